@@ -3,8 +3,8 @@
 Sample script to deploy an Auto Scaling Group stack using CDK-Factory
 """
 
+import functools
 import os
-import aws_cdk as cdk
 from aws_cdk import App, Stack, Environment
 from constructs import Construct
 
@@ -13,6 +13,43 @@ from cdk_factory.configurations.stack import StackConfig
 from cdk_factory.workload.workload_factory import WorkloadConfig
 from cdk_factory.stack_library.auto_scaling.auto_scaling_stack import AutoScalingStack
 from cdk_factory.stack_library.security_group.security_group_stack import SecurityGroupStack
+from cdk_factory.utilities.placeholders import expand_placeholders
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json as _json
+
+# Directory containing this script; sample configs are resolved against it
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config(config_path: str, mtime: float) -> dict:
+    """
+    Load and parse a JSON config file.
+
+    Results are memoized by (path, mtime) so stacks sharing the same config
+    only parse it once per synth, while edits to the file are still picked up.
+    """
+    with open(config_path, "rb") as f:
+        return _json.loads(f.read())
+
+
+def _substitute(value, substitutions: dict):
+    """
+    Recursively replace ``${NAME}`` placeholders in a decoded config.
+
+    Walks the structure once, returning new lists/dicts so the (cached)
+    source config is never mutated.
+    """
+    if isinstance(value, str):
+        return expand_placeholders(value, substitutions.get)
+    if isinstance(value, list):
+        return [_substitute(v, substitutions) for v in value]
+    if isinstance(value, dict):
+        return {k: _substitute(v, substitutions) for k, v in value.items()}
+    return value
 
 
 class AutoScalingSampleStack(Stack):
@@ -37,12 +74,8 @@ class AutoScalingSampleStack(Stack):
         config_file = self.node.try_get_context("config_file") or "auto_scaling_sample.json"
         
         # Load configuration from file if specified
-        import json
-        import os
-        
-        config_path = os.path.join(os.path.dirname(__file__), config_file)
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        config_path = os.path.join(_HERE, config_file)
+        config_data = _load_config(config_path, os.path.getmtime(config_path))
         
         # Create security group for the Auto Scaling Group if needed
         # This is optional if you already have security groups defined
@@ -87,11 +120,8 @@ class AutoScalingSampleStack(Stack):
         # Get the security group ID and update the auto scaling config
         sg_id = security_group_stack.security_group.security_group_id
         
-        # Update the security group ID in the config
-        if "auto_scaling" in config_data and "security_group_ids" in config_data["auto_scaling"]:
-            for i, sg in enumerate(config_data["auto_scaling"]["security_group_ids"]):
-                if sg == "${SECURITY_GROUP_ID}":
-                    config_data["auto_scaling"]["security_group_ids"][i] = sg_id
+        # Resolve ${...} placeholders (e.g. the security group ID) in one pass
+        config_data = _substitute(config_data, {"SECURITY_GROUP_ID": sg_id})
         
         # Create auto scaling stack
         stack_config = StackConfig(config_data)
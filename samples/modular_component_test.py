@@ -5,20 +5,12 @@ This script demonstrates how to use individual stack library components.
 """
 
 import os
-import aws_cdk as cdk
 from aws_cdk import App, Stack, Environment
 from constructs import Construct
 
 from cdk_factory.configurations.deployment import DeploymentConfig
 from cdk_factory.configurations.stack import StackConfig
-from cdk_factory.workload.workload_factory import WorkloadConfig, WorkloadFactory
-
-# Import individual stack library modules
-from cdk_factory.stack_library.vpc.vpc_stack import VpcStack
-from cdk_factory.stack_library.security_group.security_group_stack import (
-    SecurityGroupStack,
-)
-from cdk_factory.stack_library.rds.rds_stack import RdsStack
+from cdk_factory.workload.workload_factory import WorkloadConfig
 
 
 class VpcOnlyStack(Stack):
@@ -41,7 +33,6 @@ class VpcOnlyStack(Stack):
                 "ssm_prefix_template": "/{environment}/{resource_type}/{attribute}",
             }
         )
-        workload_factory = WorkloadFactory(self, workload, deployment)
 
         # Create VPC
         vpc_config = {
@@ -61,6 +52,9 @@ class VpcOnlyStack(Stack):
                 },
             },
         }
+        # Imported here so only the selected stack_type's modules are loaded
+        from cdk_factory.stack_library.vpc.vpc_stack import VpcStack
+
         vpc_stack_config = StackConfig({"vpc": vpc_config})
         vpc_stack = VpcStack(self, "VpcStack")
         vpc_stack.build(vpc_stack_config, deployment, workload)
@@ -86,7 +80,6 @@ class SecurityGroupOnlyStack(Stack):
                 "ssm_prefix_template": "/{environment}/{workload_name}/{resource_type}/{attribute}",
             }
         )
-        workload_factory = WorkloadFactory(self, workload, deployment)
 
         # Get VPC ID from context or SSM parameter
         vpc_id = self.node.try_get_context("vpc_id")
@@ -125,6 +118,11 @@ class SecurityGroupOnlyStack(Stack):
             # Override the SSM prefix template at the resource level for exports only
             "ssm_prefix_template": "/{environment}/security-groups/{resource_name}/{attribute}",
         }
+        # Imported here so only the selected stack_type's modules are loaded
+        from cdk_factory.stack_library.security_group.security_group_stack import (
+            SecurityGroupStack,
+        )
+
         sg_stack_config = StackConfig({"security_group": sg_config})
         sg_stack = SecurityGroupStack(self, "SecurityGroupStack")
         sg_stack.build(sg_stack_config, deployment, workload)
@@ -150,7 +148,6 @@ class DatabaseOnlyStack(Stack):
                 "ssm_prefix_template": "/{environment}-{resource_type}-{attribute}",
             }
         )
-        workload_factory = WorkloadFactory(self, workload, deployment)
 
         # Get context parameters (optional now with SSM)
         vpc_id = self.node.try_get_context("vpc_id")
@@ -199,12 +196,19 @@ class DatabaseOnlyStack(Stack):
             # Override the resource type for this specific resource
             "ssm_resource_type": "database",
         }
+        # Imported here so only the selected stack_type's modules are loaded
+        from cdk_factory.stack_library.rds.rds_stack import RdsStack
+
         rds_stack_config = StackConfig({"rds": rds_config})
         rds_stack = RdsStack(self, "RdsStack")
         rds_stack.build(rds_stack_config, deployment, workload)
 
 
 app = App()
+_ENV = Environment(
+    account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
+    region=os.environ.get("CDK_DEFAULT_REGION"),
+)
 
 # Deploy the stacks based on context parameter
 stack_type = app.node.try_get_context("stack_type") or "vpc"
@@ -213,28 +217,19 @@ if stack_type == "vpc":
     VpcOnlyStack(
         app,
         "VpcOnlyStack",
-        env=Environment(
-            account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
-            region=os.environ.get("CDK_DEFAULT_REGION"),
-        ),
+        env=_ENV,
     )
 elif stack_type == "sg":
     SecurityGroupOnlyStack(
         app,
         "SecurityGroupOnlyStack",
-        env=Environment(
-            account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
-            region=os.environ.get("CDK_DEFAULT_REGION"),
-        ),
+        env=_ENV,
     )
 elif stack_type == "db":
     DatabaseOnlyStack(
         app,
         "DatabaseOnlyStack",
-        env=Environment(
-            account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
-            region=os.environ.get("CDK_DEFAULT_REGION"),
-        ),
+        env=_ENV,
     )
 else:
     raise ValueError(f"Unsupported stack_type: {stack_type}")
@@ -21,6 +21,8 @@ from cdk_factory.utilities.configuration_loader import ConfigurationLoader
 from cdk_factory.utilities.file_operations import FileOperations
 from cdk_factory.version import __version__
 
+logger = Logger(__name__)
+
 
 class CdkAppFactory:
     """CDK App Wrapper"""
@@ -106,7 +108,7 @@ class CdkAppFactory:
             runtime_directory=self.runtime_directory,
         )
 
-        print("config_path", self.config_path)
+        logger.debug(f"config_path: {self.config_path}")
         if not self.config_path:
             raise Exception("No configuration file provided")
         if not os.path.exists(self.config_path):
@@ -147,7 +149,6 @@ class CdkAppFactory:
         except Exception as e:
             self._print_unexpected_error(e)
             sys.exit(1)
-            sys.exit(1)
 
         print("☁️ cloud assembly dir", assembly.directory)
 
@@ -4,7 +4,11 @@ Maintainers: Eric Wilson
 MIT License. See Project Root for the license information.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+# Shared read-only default for configs without any SSM settings (the common case)
+NO_SSM_CONFIG: Mapping[str, Any] = MappingProxyType({})
 
 
 class BaseConfig:
@@ -51,6 +55,10 @@ class BaseConfig:
             config: Dictionary containing configuration values
         """
         self.__config = config or {}
+        # Lazily built lookups; the config dict is treated as immutable once loaded
+        self.__ssm_exports: Optional[Dict[str, str]] = None
+        self.__ssm_imports: Optional[Dict[str, str]] = None
+        self.__ssm_paths: Optional[Mapping[str, str]] = None
         
     @property
     def dictionary(self) -> Dict[str, Any]:
@@ -102,7 +110,9 @@ class BaseConfig:
         Returns:
             Dictionary mapping attribute names to SSM parameter paths for export
         """
-        return self.ssm.get("exports", {})
+        if self.__ssm_exports is None:
+            self.__ssm_exports = self.ssm.get("exports", {})
+        return self.__ssm_exports
     
     @property
     def ssm_imports(self) -> Dict[str, str]:
@@ -121,7 +131,9 @@ class BaseConfig:
         Returns:
             Dictionary mapping attribute names to SSM parameter paths for import
         """
-        return self.ssm.get("imports", {})
+        if self.__ssm_imports is None:
+            self.__ssm_imports = self.ssm.get("imports", {})
+        return self.__ssm_imports
         
             
     def get(self, key: str, default: Any = None) -> Any:
@@ -197,8 +209,11 @@ class BaseConfig:
         Returns:
             The SSM parameter path or None if not defined
         """
-        path_key = f"{key}_path"
-        path = self.ssm_exports.get(path_key)
+        if "ssm" not in self.__config:
+            # subclasses may override ssm_exports, but always source it from "ssm"
+            return None
+
+        path = self.ssm_exports.get(f"{key}_path")
         
         if path and resource_type:
             return self.format_ssm_path(path, resource_type, resource_name or key, key, context)
@@ -218,8 +233,11 @@ class BaseConfig:
         Returns:
             The SSM parameter path or None if not defined
         """
-        path_key = f"{key}_path"
-        path = self.ssm_imports.get(path_key)
+        if "ssm" not in self.__config:
+            # subclasses may override ssm_imports, but always source it from "ssm"
+            return None
+
+        path = self.ssm_imports.get(f"{key}_path")
         
         if path and resource_type:
             return self.format_ssm_path(path, resource_type, resource_name or key, key, context)
@@ -242,9 +260,15 @@ class BaseConfig:
         Returns:
             The SSM parameter path or None if not defined
         """
-        path_key = f"{key}_path"
-        # Check exports first, then imports, then the legacy ssm_parameters
-        path = self.ssm_exports.get(path_key) or self.ssm_imports.get(path_key) or self.__config.get("ssm_parameters", {}).get(path_key)
+        if self.__ssm_paths is None and "ssm" not in self.__config and "ssm_parameters" not in self.__config:
+            self.__ssm_paths = NO_SSM_CONFIG
+        elif self.__ssm_paths is None:
+            # Exports take precedence, then imports, then the legacy ssm_parameters.
+            # Empty values never shadow a lower-precedence source.
+            self.__ssm_paths = {}
+            for source in (self.__config.get("ssm_parameters", NO_SSM_CONFIG), self.ssm_imports, self.ssm_exports):
+                self.__ssm_paths.update((k, v) for k, v in source.items() if v)
+        path = self.__ssm_paths.get(f"{key}_path")
         
         if path and resource_type:
             return self.format_ssm_path(path, resource_type, resource_name or key, key, context)
@@ -11,14 +11,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional, List
 
 from aws_lambda_powertools import Logger
-from boto3_assist.ssm.parameter_store.parameter_store import ParameterStore
 from boto3_assist.s3.s3_object import S3Object
 from cdk_factory.utilities.json_loading_utility import JsonLoadingUtility
 
 logger = Logger(__name__)
 
-parameters = ParameterStore()
-
 
 class CdkConfig:
     """
@@ -127,6 +124,14 @@ class CdkConfig:
                 "Failed to load Config. Config must be a dictionary at this point."
             )
 
+    def __write_config_snapshots(self) -> bool:
+        """
+        Whether the .dynamic/ config snapshots are written to disk.
+        They are debugging artifacts; set CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT=1
+        to skip the serialization and disk I/O.
+        """
+        return os.getenv("CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT") != "1"
+
     def __resolve_config_file_path(self, config_file: str):
         """Resolve the config file path (locally or s3://)"""
 
@@ -217,8 +222,6 @@ class CdkConfig:
         path = os.path.join(Path(self._resolved_config_file_path).parent, file_name)
         self._dynamic_config_path = path
 
-        if not os.path.exists(Path(path).parent):
-            os.makedirs(Path(path).parent)
         cdk = config.get("cdk", {})
         if replacements:
             config = JsonLoadingUtility.recursive_replace(config, replacements)
@@ -242,6 +245,12 @@ class CdkConfig:
         # any stack build() runs, the queues are already plain resolved data.
         self._resolve_lambda_config_paths(config)
 
+        if not self.__write_config_snapshots():
+            return config
+
+        if not os.path.exists(Path(path).parent):
+            os.makedirs(Path(path).parent)
+
         JsonLoadingUtility.save(config, path)
 
         # Save a fully-resolved runtime snapshot for debugging/troubleshooting
@@ -522,6 +531,7 @@ class CdkConfig:
 
         Call after all stack build() methods have run to capture
         post-mutation state (merged permissions, env vars, etc.).
+        Skipped when CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT=1.
 
         Raises:
             ValueError: If the dynamic config file path has not been
@@ -533,5 +543,8 @@ class CdkConfig:
                 "Ensure CdkConfig was initialized with a valid config path."
             )
 
+        if not self.__write_config_snapshots():
+            return
+
         print(f"📀 Saving post-build config snapshot to {self._dynamic_config_path}")
         JsonLoadingUtility.save(self.config, self._dynamic_config_path)
@@ -14,6 +14,13 @@ class DevOps:
     DevOps Configuration
     """
 
+    __slots__ = (
+        "_DevOps__devops",
+        "_DevOps__lambda_layers",
+        "_DevOps__code_repository",
+        "_DevOps__commands",
+    )
+
     def __init__(self, devops: dict) -> None:
         self.__devops = devops
         self.__lambda_layers = LambdaLayersConfig(devops.get("lambda_layers", {}))
@@ -58,18 +65,17 @@ class DevOps:
     @property
     def code_repository(self) -> CodeRepositoryConfig:
         """The Code Repository"""
-        if not self.__code_repository:
-            self.__code_repository = CodeRepositoryConfig(
+        if self.__code_repository is None:
+            code_repository = CodeRepositoryConfig(
                 self.__devops.get("code_repository", {})
             )
-            if (
-                not self.__code_repository.repository
-                or not self.__code_repository.repository
-            ):
+            if not code_repository.repository:
                 raise ValueError(
                     "Code Repository is not defined in the configuration "
                     "workload.devops.code_repository.repository: {}"
                 )
+            # only cache once validated so a bad config keeps raising
+            self.__code_repository = code_repository
         return self.__code_repository
 
     @property
@@ -1,10 +1,13 @@
 """Enhanced SSM Parameter Configuration for CDK Factory"""
 
 import os
-from typing import Dict, List, Optional, Union, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from cdk_factory.utilities.placeholders import expand_placeholders
+
 
 class SsmMode(Enum):
     AUTO = "auto"
@@ -12,7 +15,20 @@ class SsmMode(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+def _require_env_var(env_var: str) -> str:
+    """Resolve a ${VAR} placeholder from the process environment; unset variables are an error"""
+    env_value = os.getenv(env_var)
+    if not env_value:
+        raise ValueError(
+            f"Environment variable '{env_var}' is not set. "
+            f"Cannot default to 'dev' as this may cause cross-environment contamination. "
+            f"Best practice: Set 'environment' at workload level in your config. "
+            f"Alternatively, set the {env_var} environment variable."
+        )
+    return env_value
+
+
+@dataclass(slots=True)
 class SsmParameterDefinition:
     """Defines an SSM parameter with its metadata"""
 
@@ -42,6 +58,16 @@ class EnhancedSsmConfig:
         self._deployment_config = (
             deployment_config or {}
         )  # Deprecated, for backward compatibility
+        # Pattern with every placeholder except {attribute} pre-filled; built
+        # lazily by get_parameter_path so environment errors still surface there
+        self._path_template: Optional[str] = None
+        # Literal prefix when the template is "<prefix>{attribute}" (the default
+        # pattern), letting get_parameter_path concatenate instead of format
+        self._path_prefix: Optional[str] = None
+        # Resolved environment, cached on first access
+        self._environment: Optional[str] = None
+        # (auto exports, auto imports) for this resource type, looked up once
+        self._auto = RESOURCE_AUTO.get(resource_type, _NO_AUTO)
 
     @property
     def enabled(self) -> bool:
@@ -84,6 +110,12 @@ class EnhancedSsmConfig:
               }
             }
         """
+        if self._environment is None:
+            self._environment = self._resolve_environment()
+        return self._environment
+
+    def _resolve_environment(self) -> str:
+        """Resolve the environment from config sources (see ``environment``)"""
         # 1. Try workload config first (STANDARD LOCATION)
         env = self._workload_config.get("environment")
 
@@ -100,17 +132,8 @@ class EnhancedSsmConfig:
             env = self.config.get("environment", "${ENVIRONMENT}")
 
         # 5. Resolve environment variables
-        if isinstance(env, str) and env.startswith("${") and env.endswith("}"):
-            env_var = env[2:-1]
-            env_value = os.getenv(env_var)
-            if not env_value:
-                raise ValueError(
-                    f"Environment variable '{env_var}' is not set. "
-                    f"Cannot default to 'dev' as this may cause cross-environment contamination. "
-                    f"Best practice: Set 'environment' at workload level in your config. "
-                    f"Alternatively, set the {env_var} environment variable."
-                )
-            return env_value
+        if isinstance(env, str) and "${" in env:
+            return expand_placeholders(env, _require_env_var)
 
         # If still no environment, fail explicitly
         if not env:
@@ -160,37 +183,78 @@ class EnhancedSsmConfig:
         # Convert underscore attribute names to hyphen format for consistent SSM paths
         formatted_attribute = attribute.replace("_", "-")
 
+        if self._path_template is None:
+            if "{{" in self.pattern or "}}" in self.pattern:
+                # The pre-fill pass would unescape the pattern's literal braces
+                # before {attribute} is substituted, so format it in one go
+                return self._format_pattern(formatted_attribute)
+
+            self._path_template = self._build_path_template()
+            prefix = self._path_template[: -len("{attribute}")]
+            if self._path_template.endswith("{attribute}") and not (
+                "{" in prefix or "}" in prefix
+            ):
+                self._path_prefix = prefix
+
+        if self._path_prefix is not None:
+            return self._path_prefix + formatted_attribute
+
+        return self._path_template.format(attribute=formatted_attribute)
+
+    def _build_path_template(self) -> str:
+        """
+        Pre-fill the per-instance constants of the pattern, leaving only
+        {attribute} to be substituted per call.
+        """
+
+        def escape(value: str) -> str:
+            return str(value).replace("{", "{{").replace("}", "}}")
+
+        return self._format_pattern("{attribute}", escape=escape)
+
+    def _format_pattern(self, attribute: str, escape=str) -> str:
+        """Substitute the pattern's placeholders, passing each value through escape"""
+        workload = escape(self.workload)
         # Use enhanced pattern (support both workload and organization for backward compatibility)
         return self.pattern.format(
-            workload=self.workload,
-            organization=self.workload,  # Backward compatibility
-            environment=self.environment,
-            stack_type=self.resource_type,
-            resource_name=self.resource_name,
-            attribute=formatted_attribute,
+            workload=workload,
+            organization=workload,  # Backward compatibility
+            environment=escape(self.environment),
+            stack_type=escape(self.resource_type),
+            resource_name=escape(self.resource_name),
+            attribute=attribute,
         )
 
     def get_export_definitions(self) -> List[SsmParameterDefinition]:
         """Get list of parameters to export"""
+        if not self.enabled:
+            return []
+
         exports = self.config.get("exports", {})
-        definitions = []
 
-        # Add auto-discovered exports
+        # Explicit exports first, in config order
+        definitions = [
+            SsmParameterDefinition(
+                attribute=attr,
+                path=self.get_parameter_path(
+                    attr, None if path_config == "auto" else path_config
+                ),
+                auto_export=True,
+            )
+            for attr, path_config in exports.items()
+        ]
+
+        # Then auto-discovered exports not already configured.  The config's
+        # exports dict is left untouched.
         if self.auto_export:
-            auto_exports = self._get_auto_exports()
-            for attr in auto_exports:
-                if attr not in exports:
-                    exports[attr] = "auto"
-
-        # Convert to parameter definitions
-        for attr, path_config in exports.items():
-            custom_path = None if path_config == "auto" else path_config
-            definitions.append(
+            definitions.extend(
                 SsmParameterDefinition(
                     attribute=attr,
-                    path=self.get_parameter_path(attr, custom_path),
+                    path=self.get_parameter_path(attr),
                     auto_export=True,
                 )
+                for attr in self._get_auto_exports()
+                if attr not in exports
             )
 
         return definitions
@@ -199,6 +263,9 @@ class EnhancedSsmConfig:
         self, context: Dict[str, Any] = None
     ) -> List[SsmParameterDefinition]:
         """Get SSM parameter definitions for imports"""
+        if not self.enabled:
+            return []
+
         definitions = []
 
         # Process explicit imports (can be dict format like {"user_pool_arn": "auto"} or list format)
@@ -215,9 +282,7 @@ class EnhancedSsmConfig:
 
                     if import_value == "auto":
                         # Use auto-discovery with source mapping
-                        imports_config = RESOURCE_AUTO_IMPORTS.get(
-                            self.resource_type, {}
-                        )
+                        imports_config = self._auto[1]
                         import_info = imports_config.get(attribute, {})
                         source_resource_type = import_info.get("source_resource_type")
 
@@ -268,7 +333,7 @@ class EnhancedSsmConfig:
 
         # Process auto-discovered imports
         if self.auto_import:
-            imports_config = RESOURCE_AUTO_IMPORTS.get(self.resource_type, {})
+            imports_config = self._auto[1]
             for attribute, import_info in imports_config.items():
                 # Skip if already processed in explicit imports
                 if (
@@ -318,14 +383,13 @@ class EnhancedSsmConfig:
 
         return definitions
 
-    def _get_auto_exports(self) -> List[str]:
+    def _get_auto_exports(self) -> Tuple[str, ...]:
         """Get auto-discovered exports based on resource type"""
-        return RESOURCE_AUTO_EXPORTS.get(self.resource_type, [])
+        return self._auto[0]
 
     def _get_auto_imports(self) -> List[str]:
         """Get auto-discovered imports based on resource type"""
-        imports_config = RESOURCE_AUTO_IMPORTS.get(self.resource_type, {})
-        return list(imports_config.keys())
+        return list(self._auto[1].keys())
 
     def _get_parameter_path_for_source(
         self, attribute: str, source_resource_type: str, source_resource_name: str
@@ -341,39 +405,39 @@ class EnhancedSsmConfig:
 
 # Resource type definitions for auto-discovery
 RESOURCE_AUTO_EXPORTS = {
-    "vpc": [
+    "vpc": (
         "vpc_id",
         "vpc_cidr",
         "public_subnet_ids",
         "private_subnet_ids",
         "isolated_subnet_ids",
-    ],
-    "security_group": ["security_group_id"],
-    "rds": ["db_instance_id", "db_endpoint", "db_port", "db_secret_arn"],
-    "api_gateway": [
+    ),
+    "security_group": ("security_group_id",),
+    "rds": ("db_instance_id", "db_endpoint", "db_port", "db_secret_arn"),
+    "api_gateway": (
         "api_id",
         "api_arn",
         "api_url",
         "root_resource_id",
         "authorizer_id",
-    ],
-    "api-gateway": [
+    ),
+    "api-gateway": (
         "api_id",
         "api_arn",
         "api_url",
         "root_resource_id",
         "authorizer_id",
-    ],
-    "cognito": [
+    ),
+    "cognito": (
         "user_pool_id",
         "user_pool_arn",
         "user_pool_name",
         "user_pool_client_id",
         "authorizer_id",
-    ],
-    "lambda": ["function_name", "function_arn"],
-    "s3": ["bucket_name", "bucket_arn"],
-    "dynamodb": ["table_name", "table_arn", "table_stream_arn"],
+    ),
+    "lambda": ("function_name", "function_arn"),
+    "s3": ("bucket_name", "bucket_arn"),
+    "dynamodb": ("table_name", "table_arn", "table_stream_arn"),
 }
 
 # Enhanced import structure that maps attributes to their source resource types
@@ -410,3 +474,14 @@ RESOURCE_AUTO_IMPORTS = {
         "subnet_ids": {"source_resource_type": "vpc"},
     },
 }
+
+# Both auto-discovery tables merged per resource type: (exports, imports)
+RESOURCE_AUTO = {
+    resource_type: (
+        RESOURCE_AUTO_EXPORTS.get(resource_type, ()),
+        RESOURCE_AUTO_IMPORTS.get(resource_type, {}),
+    )
+    for resource_type in RESOURCE_AUTO_EXPORTS.keys() | RESOURCE_AUTO_IMPORTS.keys()
+}
+
+_NO_AUTO = ((), MappingProxyType({}))
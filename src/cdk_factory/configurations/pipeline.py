@@ -4,7 +4,9 @@ Maintainers: Eric Wilson
 MIT License.  See Project Root for the license information.
 """
 
+import functools
 import os
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 
 from cdk_factory.configurations.deployment import DeploymentConfig
@@ -22,7 +24,11 @@ class PipelineConfig:
         self.pipeline: dict = pipeline
         self.workload: dict = workload
         self._deployments: List[DeploymentConfig] = []
-        self._stages: List[PipelineStageConfig] = []
+        self._stages: Optional[List[PipelineStageConfig]] = None
+        # read on every deployment/stage during synth, so resolve them once
+        enabled = self.pipeline.get("enabled")
+        self._enabled: bool = str(enabled).lower() == "true" or enabled is True
+        self._workload_name = self.workload.get("name")
         self.__load_deployments()
 
     def __load_deployments(self):
@@ -33,14 +39,14 @@ class PipelineConfig:
         deployments: List[DeploymentConfig] = []
 
         # this is the newer way
-        for deployment in self.workload.get("deployments", []):
+        for deployment in self.workload.get("deployments", ()):
             if deployment.get("mode") == "pipeline":
                 deployments.append(
                     DeploymentConfig(workload=self.workload, deployment=deployment)
                 )
 
         # sort the deployments by order
-        deployments.sort(key=lambda x: x.order)
+        deployments.sort(key=attrgetter("order"))
         self._deployments = deployments
 
     @property
@@ -55,9 +61,11 @@ class PipelineConfig:
         """
         Returns the stages for this pipeline
         """
-        if not self._stages:
-            for stage in self.pipeline.get("stages", []):
-                self._stages.append(PipelineStageConfig(stage, self.workload))
+        if self._stages is None:
+            self._stages = [
+                PipelineStageConfig(stage, self.workload)
+                for stage in self.pipeline.get("stages", ())
+            ]
         return self._stages
 
     @property
@@ -70,7 +78,7 @@ class PipelineConfig:
     @property
     def workload_name(self):
         """Gets the workload name"""
-        return self.workload.get("name")
+        return self._workload_name
 
     @property
     def branch(self):
@@ -84,8 +92,7 @@ class PipelineConfig:
         """
         Returns the if this pipeline is enabled
         """
-        value = self.pipeline.get("enabled")
-        return str(value).lower() == "true" or value is True
+        return self._enabled
 
     @property
     def trigger_on_branch_change(self) -> bool:
@@ -120,40 +127,19 @@ class PipelineConfig:
         We need to avoid using things like branch names and environment names
         as we may want to change them in the future for a given stack.
         """
-        resource_name = name
-
-        if not resource_name:
+        if not name:
             raise ValueError("Resource name is required")
 
-        resource_name = str(resource_name).replace(
-            "{{workload-name}}", self.workload_name
-        )
-        resource_name = str(resource_name).replace("{{pipeline-name}}", self.name)
-
-        resource_name = str(resource_name).replace(
-            "{{environment}}", os.getenv("ENVIRONMENT", "")
+        return _build_resource_name(
+            name,
+            self.workload_name,
+            self.name,
+            os.getenv("ENVIRONMENT", ""),
+            resource_type,
+            str(self.workload.get("auto_fix_resource_names", True)).lower() == "true",
+            lower_case,
         )
 
-        # remove any leading dashes -
-        parts = resource_name.split("-")
-        # remove any empty elements in the array
-        parts = [x for x in parts if x]
-        # put it back
-        resource_name = "-".join(parts)
-
-        if resource_type:
-            resource_name = ResourceNaming.validate_name(
-                resource_name,
-                resource_type=resource_type,
-                fix=str(self.workload.get("auto_fix_resource_names", True)).lower()
-                == "true",
-            )
-
-        if lower_case:
-            resource_name = resource_name.lower()
-
-        return resource_name
-
     def code_artifact_logins(self, include_profile: bool = False) -> List[str]:
         """
         Returns the code artifact logins (if any)
@@ -182,3 +168,42 @@ class PipelineConfig:
         Configured via pipeline.cross_account_role_arns in the config JSON.
         """
         return self.pipeline.get("cross_account_role_arns", [])
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_resource_name(
+    name: str,
+    workload_name: str,
+    pipeline_name: str,
+    environment: str,
+    resource_type: Optional[ResourceTypes],
+    fix: bool,
+    lower_case: bool,
+) -> str:
+    """
+    Memoized body of PipelineConfig.build_resource_name.
+    Synth asks for the same handful of names repeatedly, so every input that
+    affects the result (including the ENVIRONMENT value) is part of the key.
+    """
+    resource_name = str(name).replace("{{workload-name}}", workload_name)
+    resource_name = resource_name.replace("{{pipeline-name}}", pipeline_name)
+    resource_name = resource_name.replace("{{environment}}", environment)
+
+    # remove any leading dashes -
+    parts = resource_name.split("-")
+    # remove any empty elements in the array
+    parts = [x for x in parts if x]
+    # put it back
+    resource_name = "-".join(parts)
+
+    if resource_type:
+        resource_name = ResourceNaming.validate_name(
+            resource_name,
+            resource_type=resource_type,
+            fix=fix,
+        )
+
+    if lower_case:
+        resource_name = resource_name.lower()
+
+    return resource_name
@@ -23,10 +23,11 @@ class ApiGatewayConfig(EnhancedBaseConfig):
             ),
         )
         self.__config = config or {}
+        self.__api_type: str = self.__config.get("api_type", "REST").upper()
 
     @property
     def name(self) -> str | None:
-        return self.__config.get("name") or self.__config.get("name")
+        return self.__config.get("name")
 
     @property
     def description(self) -> str | None:
@@ -111,7 +112,7 @@ class ApiGatewayConfig(EnhancedBaseConfig):
     @property
     def api_type(self) -> str:
         """API type: REST (default) or HTTP"""
-        return self.__config.get("api_type", "REST").upper()
+        return self.__api_type
 
     @property
     def routes(self) -> list[dict]:
@@ -143,11 +143,6 @@ class CognitoConfig(EnhancedBaseConfig):
         """Passkey user verification config"""
         return self.__config.get("passkey_user_verification")
 
-    @property
-    def password_policy(self) -> dict | None:
-        """Password policy config (min_length, require_uppercase, etc.)"""
-        return self.__config.get("password_policy")
-
     @property
     def removal_policy(self) -> str:
         """Removal policy (DESTROY, RETAIN, SNAPSHOT)"""
@@ -208,11 +203,6 @@ class CognitoConfig(EnhancedBaseConfig):
         """SNS region"""
         return self.__config.get("sns_region")
 
-    @property
-    def standard_attributes(self) -> dict | None:
-        """Standard attributes config"""
-        return self.__config.get("standard_attributes")
-
     @property
     def standard_threat_protection_mode(self) -> str | None:
         """Standard threat protection mode"""
@@ -233,22 +223,6 @@ class CognitoConfig(EnhancedBaseConfig):
         """Advanced security mode (OFF, AUDIT, ENFORCED)"""
         return self.__config.get("advanced_security_mode")
 
-    # Deprecated/legacy or rarely used
-    @property
-    def removal_policy(self) -> str:
-        """Removal policy (DESTROY, RETAIN, SNAPSHOT)"""
-        return self.__config.get("removal_policy", "RETAIN")
-
-    @property
-    def user_verification(self) -> dict | None:
-        """User verification config (email_subject, sms_message, etc.)"""
-        return self.__config.get("user_verification")
-
-    @property
-    def user_invitation(self) -> dict | None:
-        """User invitation config (email_subject, sms_message, etc.)"""
-        return self.__config.get("user_invitation")
-
     @property
     def deletion_protection(self) -> bool:
         """Whether deletion protection is enabled (default: False)"""
@@ -6,6 +6,12 @@ Defines the configuration schema for ECS cluster stacks.
 
 from typing import Optional, Dict, Any, List
 
+# Instance role policies used when managed_policies isn't configured
+_DEFAULT_MANAGED_POLICIES = (
+    "service-role/AmazonEC2ContainerServiceforEC2Role",
+    "AmazonSSMManagedInstanceCore",
+)
+
 
 class EcsClusterConfig:
     """
@@ -17,6 +23,9 @@ class EcsClusterConfig:
     
     def __init__(self, config: Dict[str, Any]) -> None:
         self._config = config or {}
+        # resolved on first access
+        self._ssm_exports: Optional[Dict[str, str]] = None
+        self._ssm_imports: Optional[Dict[str, Any]] = None
     
     @property
     def dictionary(self) -> Dict[str, Any]:
@@ -76,10 +85,11 @@ class EcsClusterConfig:
     @property
     def managed_policies(self) -> List[str]:
         """List of AWS managed policies to attach to the instance role"""
-        return self._config.get("managed_policies", [
-            "service-role/AmazonEC2ContainerServiceforEC2Role",
-            "AmazonSSMManagedInstanceCore"
-        ])
+        policies = self._config.get("managed_policies")
+        if policies is None:
+            # a fresh list so callers can't mutate the shared default
+            return list(_DEFAULT_MANAGED_POLICIES)
+        return policies
     
     @property
     def inline_policies(self) -> Optional[Dict[str, Dict[str, Any]]]:
@@ -100,9 +110,13 @@ class EcsClusterConfig:
     @property
     def ssm_exports(self) -> Dict[str, str]:
         """SSM parameter exports"""
-        return self.ssm.get("exports", {})
+        if self._ssm_exports is None:
+            self._ssm_exports = self.ssm.get("exports", {})
+        return self._ssm_exports
 
     @property
     def ssm_imports(self) -> Dict[str, Any]:
         """SSM parameter imports"""
-        return self.ssm.get("imports", {})
+        if self._ssm_imports is None:
+            self._ssm_imports = self.ssm.get("imports", {})
+        return self._ssm_imports
@@ -12,6 +12,9 @@ class EcsServiceConfig:
 
     def __init__(self, config: Dict[str, Any]) -> None:
         self._config = config
+        # resolved on first access
+        self._ssm_exports: Optional[Dict[str, str]] = None
+        self._ssm_imports: Optional[Dict[str, Any]] = None
 
     @property
     def name(self) -> str:
@@ -152,24 +155,26 @@ class EcsServiceConfig:
     @property
     def ssm_exports(self) -> Dict[str, str]:
         """SSM parameter exports"""
-        return self.ssm.get("exports", {})
+        if self._ssm_exports is None:
+            self._ssm_exports = self.ssm.get("exports", {})
+        return self._ssm_exports
 
     @property
     def ssm_imports(self) -> Dict[str, Any]:
-        """SSM parameter imports"""
-        # Check both nested and flat structures for backwards compatibility
-        if "ssm" in self._config and "imports" in self._config["ssm"]:
-            imports = self._config["ssm"]["imports"]
-        else:
+        """SSM parameter imports (including any load_balancer SSM imports)"""
+        if self._ssm_imports is None:
             imports = self.ssm.get("imports", {})
-        
-        # Add load_balancer SSM imports if they exist
-        if self.load_balancer_config and "ssm" in self.load_balancer_config:
-            lb_ssm = self.load_balancer_config["ssm"]
-            if "imports" in lb_ssm:
-                imports.update(lb_ssm["imports"])
-        
-        return imports
+
+            # Add load_balancer SSM imports if they exist
+            load_balancer = self.load_balancer_config
+            if load_balancer and "ssm" in load_balancer:
+                lb_ssm = load_balancer["ssm"]
+                if "imports" in lb_ssm:
+                    imports.update(lb_ssm["imports"])
+
+            self._ssm_imports = imports
+
+        return self._ssm_imports
 
     @property
     def deployment_type(self) -> str:
@@ -5,12 +5,21 @@ MIT License. See Project Root for license information.
 """
 
 import re
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple, Literal
 from aws_lambda_powertools import Logger
 from cdk_factory.configurations.enhanced_base_config import EnhancedBaseConfig
 
 logger = Logger(service="RdsConfig")
 
+# Sanitization patterns, compiled once at import
+_INVALID_IDENTIFIER_CHARS = re.compile(r"[^a-z0-9-]")
+_REPEATED_HYPHENS = re.compile(r"-{2,}")
+_INVALID_NAME_CHARS = re.compile(r"[^A-Za-z0-9_]")
+# Oracle SIDs don't allow underscores
+_INVALID_ORACLE_NAME_CHARS = re.compile(r"[^A-Za-z0-9]")
+_STARTS_WITH_LETTER = re.compile(r"[A-Za-z]")
+
 # Supported RDS engines
 Engine = Literal[
     "mysql",
@@ -83,7 +92,7 @@ class RdsConfig(EnhancedBaseConfig):
         s = identifier.lower()
 
         # Keep only lowercase letters, digits, hyphen
-        s_clean = re.sub(r"[^a-z0-9-]", "", s)
+        s_clean = _INVALID_IDENTIFIER_CHARS.sub("", s)
         if s_clean != s:
             notes.append("removed invalid characters (only a-z, 0-9, '-' allowed)")
         s = s_clean
@@ -93,13 +102,13 @@ class RdsConfig(EnhancedBaseConfig):
                 f"Instance identifier '{identifier}' contains no valid characters"
             )
 
-        # Must start with letter
-        if not re.match(r"^[a-z]", s):
+        # Must start with letter (s is already lowercase)
+        if not _STARTS_WITH_LETTER.match(s):
             s = f"db{s}"
             notes.append("prefixed with 'db' to start with a letter")
 
         # Collapse consecutive hyphens
-        s_collapsed = re.sub(r"-{2,}", "-", s)
+        s_collapsed = _REPEATED_HYPHENS.sub("-", s)
         if s_collapsed != s:
             s = s_collapsed
             notes.append("collapsed consecutive hyphens")
@@ -124,9 +133,9 @@ class RdsConfig(EnhancedBaseConfig):
         """Database engine"""
         return self.__config.get("engine", "postgres")
 
-    @property
+    @cached_property
     def engine_version(self) -> str:
-        """Database engine version"""
+        """Database engine version (validated on first read)"""
         engine_version = self.__config.get("engine_version")
         if not engine_version:
             raise ValueError("No engine version found")
@@ -137,20 +146,20 @@ class RdsConfig(EnhancedBaseConfig):
         """Database instance class"""
         return self.__config.get("instance_class", "t3.micro")
 
-    @property
+    @cached_property
     def database_name(self) -> str | None:
         """
         Name of the database to create (sanitized for RDS requirements)
-        Optional and not required
+        Optional and not required. Sanitized once and cached.
         """
         raw_name = self.__config.get("database_name")
         if not raw_name:
             return None
         return self._sanitize_database_name(raw_name)
 
-    @property
+    @cached_property
     def master_username(self) -> str:
-        """Master username for the database (sanitized for RDS requirements)"""
+        """Master username for the database (sanitized once for RDS requirements)"""
         raw_username = self.__config.get("master_username")
         if not raw_username:
             raise ValueError(
@@ -158,9 +167,9 @@ class RdsConfig(EnhancedBaseConfig):
             )
         return self._sanitize_username(raw_username)
 
-    @property
+    @cached_property
     def secret_name(self) -> str:
-        """Name of the secret to store credentials"""
+        """Name of the secret to store credentials (validated on first read)"""
         if "secret_name" in self.__config:
             return self.__config["secret_name"]
         raise ValueError(
@@ -298,16 +307,6 @@ class RdsConfig(EnhancedBaseConfig):
         """SSM configuration"""
         return self.__config.get("ssm", {})
 
-    @property
-    def ssm_imports(self) -> Dict[str, str]:
-        """SSM parameter imports for the RDS instance"""
-        return self.ssm.get("imports", {})
-
-    @property
-    def ssm_exports(self) -> Dict[str, str]:
-        """SSM parameter exports for the RDS instance"""
-        return self.ssm.get("exports", {})
-
     def _sanitize_database_name(self, name: str) -> str:
         """
         Sanitize database name to meet RDS requirements (engine-specific).
@@ -348,7 +347,7 @@ class RdsConfig(EnhancedBaseConfig):
 
         # Determine engine-specific limits
         if engine in ("mysql", "mariadb", "aurora-mysql"):
-            allowed_chars = r"A-Za-z0-9_"
+            invalid_chars = _INVALID_NAME_CHARS
             max_len = 64
         elif engine in (
             "postgres",
@@ -356,7 +355,7 @@ class RdsConfig(EnhancedBaseConfig):
             "aurora-postgres",
             "aurora-postgresql",
         ):
-            allowed_chars = r"A-Za-z0-9_"
+            invalid_chars = _INVALID_NAME_CHARS
             max_len = 63
         elif engine in (
             "sqlserver",
@@ -365,14 +364,14 @@ class RdsConfig(EnhancedBaseConfig):
             "sqlserver-ex",
             "sqlserver-web",
         ):
-            allowed_chars = r"A-Za-z0-9_"
+            invalid_chars = _INVALID_NAME_CHARS
             max_len = 128
         elif engine in ("oracle", "oracle-ee", "oracle-se2", "oracle-se1"):
-            allowed_chars = r"A-Za-z0-9"  # No underscore for Oracle SID
+            invalid_chars = _INVALID_ORACLE_NAME_CHARS
             max_len = 8
         else:
             # Default to conservative rules
-            allowed_chars = r"A-Za-z0-9_"
+            invalid_chars = _INVALID_NAME_CHARS
             max_len = 64
             notes.append(f"unknown engine '{engine}', using default MySQL rules")
 
@@ -384,7 +383,7 @@ class RdsConfig(EnhancedBaseConfig):
                 notes.append("replaced hyphens with underscores")
 
         # Strip disallowed characters
-        s_clean = re.sub(f"[^{allowed_chars}]", "", s)
+        s_clean = invalid_chars.sub("", s)
         if s_clean != s:
             notes.append("removed invalid characters")
         s = s_clean
@@ -395,7 +394,7 @@ class RdsConfig(EnhancedBaseConfig):
             )
 
         # Must start with a letter
-        if not re.match(r"^[A-Za-z]", s):
+        if not _STARTS_WITH_LETTER.match(s):
             s = f"db{s}"
             notes.append("prefixed with 'db' to start with a letter")
 
@@ -453,7 +452,7 @@ class RdsConfig(EnhancedBaseConfig):
 
         # Replace hyphens with underscores, remove other invalid chars
         s = s.replace("-", "_")
-        s_clean = re.sub(r"[^A-Za-z0-9_]", "", s)
+        s_clean = _INVALID_NAME_CHARS.sub("", s)
         if s_clean != s:
             notes.append("removed invalid characters")
         s = s_clean
@@ -464,7 +463,7 @@ class RdsConfig(EnhancedBaseConfig):
             )
 
         # Must start with a letter
-        if not re.match(r"^[A-Za-z]", s):
+        if not _STARTS_WITH_LETTER.match(s):
             s = f"user{s}"
             notes.append("prefixed with 'user' to start with a letter")
 
@@ -14,6 +14,9 @@ from cdk_factory.configurations.resources.resource_types import (
     ResourceTypes,
 )
 
+# Characters stripped from generated hash suffixes
+_NON_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 class ResourceNaming:
     """Utility for standardizing resource names across various AWS resource types."""
@@ -49,7 +52,7 @@ class ResourceNaming:
         """
         hash_object = hashlib.sha256(input_string.encode())
         full_hash = base64.b64encode(hash_object.digest()).decode("utf-8")
-        return re.sub(r"[^a-zA-Z0-9_-]", "", full_hash)
+        return _NON_NAME_CHARS.sub("", full_hash)
 
     @staticmethod
     def _ensure_max_length(
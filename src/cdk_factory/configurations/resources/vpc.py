@@ -7,6 +7,8 @@ MIT License. See Project Root for license information.
 from typing import Any, Dict, List, Optional
 from cdk_factory.configurations.enhanced_base_config import EnhancedBaseConfig
 
+_DEFAULT_NAT_GATEWAY_COUNT = 1
+
 
 class VpcConfig(EnhancedBaseConfig):
     """
@@ -76,7 +78,10 @@ class VpcConfig(EnhancedBaseConfig):
     @property
     def nat_gateways(self) -> Dict[str, Any]:
         """NAT gateway configuration"""
-        return self.get("nat_gateways", {"count": 1})
+        nat_gateways = self.get("nat_gateways")
+        if nat_gateways is None:
+            return {"count": _DEFAULT_NAT_GATEWAY_COUNT}
+        return nat_gateways
 
     @property
     def enable_s3_endpoint(self) -> bool:
@@ -13,6 +13,14 @@ class StackConfig:
     def __init__(self, stack: dict, workload: dict) -> None:
         self.__stack: dict = stack
         self.__workload: dict = workload
+        # read for every stack during synth, so resolve it once
+        value = stack.get("enabled")
+        self.__enabled: bool = value is True or (
+            isinstance(value, str) and value.lower() == "true"
+        )
+        # validated on first read; a missing value keeps raising
+        self.__name: str | None = None
+        self.__module: str | None = None
 
     @property
     def workload(self) -> dict:
@@ -34,10 +42,12 @@ class StackConfig:
         The actual stack name. Used for CDK construct ID and CloudFormation stack name.
         This is NOT a visual label — use `description` for that.
         """
-        value = self.dictionary.get("name")
-        if not value:
-            raise ValueError("Stack name is not defined in the configuration")
-        return value
+        if self.__name is None:
+            value = self.dictionary.get("name")
+            if not value:
+                raise ValueError("Stack name is not defined in the configuration")
+            self.__name = value
+        return self.__name
 
     @property
     def description(self) -> str | None:
@@ -51,12 +61,14 @@ class StackConfig:
         """
         Returns the module name
         """
-        value = self.dictionary.get("module")
-        if not value:
-            raise ValueError(
-                "Stack module is required but it is not defined in the configuration"
-            )
-        return value
+        if self.__module is None:
+            value = self.dictionary.get("module")
+            if not value:
+                raise ValueError(
+                    "Stack module is required but it is not defined in the configuration"
+                )
+            self.__module = value
+        return self.__module
 
     @property
     def kwargs(self) -> dict:
@@ -70,8 +82,7 @@ class StackConfig:
         """
         Returns if the stack is enabled
         """
-        value = self.dictionary.get("enabled")
-        return str(value).lower() == "true" or value is True
+        return self.__enabled
 
     @property
     def dependencies(self) -> List[str]:
@@ -42,6 +42,8 @@ class WorkloadConfig:
         self.__pipeline_stages: List[PipelineStageConfig] = []
         self.__deployments: List[DeploymentConfig] = []
         self.__tags: Dict[str, Any] = {}
+        self.__name: str | None = None
+        self.__domain: str | None = None
         self.__load_config(config)
 
         self.__paths: list[str] = []
@@ -74,8 +76,17 @@ class WorkloadConfig:
         else:
             workload = copy.deepcopy(self.__app_config)
 
+        if not isinstance(workload, dict):
+            raise ValueError("Workload is not a dictionary")
+
         self.__workload = workload
 
+        primary_domain = workload.get("primary_domain")
+        if isinstance(primary_domain, str):
+            self.__domain = primary_domain.lower()
+        elif primary_domain is not None:
+            logger.error("Workload primary_domain must be a string")
+
         # Handle missing devops section gracefully
         if "devops" not in workload:
             logger.warning("Devops configuration not found in workload, using defaults")
@@ -137,19 +148,22 @@ class WorkloadConfig:
         self.__cloudfront = CloudFrontConfig(workload.get("cloudfront", {}))
         self.__resources = Resources(workload.get("resources", {}))
 
-        for pipeline in workload.get("pipelines", []):
-            self.pipelines.append(PipelineConfig(pipeline, workload=workload))
-
-        for stack in workload.get("stacks", []):
-            self.stacks.append(StackConfig(stack=stack, workload=workload))
-
-        for pipeline_stage in workload.get("stages", []):
-            self.__pipeline_stages.append(
-                PipelineStageConfig(pipeline_stage, workload=workload)
-            )
-
-        for deployment in workload.get("deployments", []):
-            self.__deployments.append(DeploymentConfig(workload, deployment))
+        self.__pipelines = [
+            PipelineConfig(pipeline, workload=workload)
+            for pipeline in workload.get("pipelines", ())
+        ]
+        self.__stacks = [
+            StackConfig(stack=stack, workload=workload)
+            for stack in workload.get("stacks", ())
+        ]
+        self.__pipeline_stages = [
+            PipelineStageConfig(pipeline_stage, workload=workload)
+            for pipeline_stage in workload.get("stages", ())
+        ]
+        self.__deployments = [
+            DeploymentConfig(workload, deployment)
+            for deployment in workload.get("deployments", ())
+        ]
 
         self.tags = workload.get("tags", {})
 
@@ -209,10 +223,9 @@ class WorkloadConfig:
     @property
     def dictionary(self) -> dict:
         """Returns the dictionary version of this object"""
+        # the dict type is validated once in __load_config
         if not self.__workload:
             raise ValueError("Workload is not defined in the configuration.")
-        if not isinstance(self.__workload, dict):
-            raise ValueError("Workload is not a dictionary")
         return self.__workload
 
     @property
@@ -220,27 +233,23 @@ class WorkloadConfig:
         """
         Returns the workload name
         """
-        value = self.dictionary.get("name")
-        if not value:
-            raise ValueError("Workload name is required")
-        if not isinstance(value, str):
-            raise ValueError("Workload name must be a string")
+        if self.__name is None:
+            value = self.dictionary.get("name")
+            if not value:
+                raise ValueError("Workload name is required")
+            if not isinstance(value, str):
+                raise ValueError("Workload name must be a string")
+            self.__name = value
 
-        return value
+        return self.__name
 
     @property
     def domain(self) -> str | None:
         """
         Returns the workload root domain
         """
-        value = self.dictionary.get("primary_domain")
-        if isinstance(value, str):
-            return value.lower()
-        else:
-            if value is not None:
-                logger.error("Workload primary_domain must be a string")
-
-            return None
+        # normalized once in __load_config
+        return self.__domain
 
     @property
     def tags(self) -> Dict[str, Any]:
@@ -270,14 +279,14 @@ class WorkloadConfig:
         """
         Sets the cdk root directory
         """
-        _values: List[str] = []
-        for v in values:
-            if os.path.isfile(v):
-                v = os.path.dirname(v)
-
-            _values.append(v)
-
-        self.__paths = list(set(_values))
+        # dedupe before stat'ing so each unique path hits the filesystem once;
+        # dict.fromkeys keeps the caller's order (paths are searched first-match)
+        self.__paths = list(
+            dict.fromkeys(
+                os.path.dirname(v) if os.path.isfile(v) else v
+                for v in dict.fromkeys(values)
+            )
+        )
 
     @property
     def cdk_app_file(self) -> str | None:
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Any, List, Mapping, Optional
 
 import aws_cdk as cdk
@@ -16,12 +17,37 @@ from cdk_factory.configurations.stack import StackConfig
 logger = Logger(__name__)
 
 
+# Viewer-request function body that 403s unknown Host headers. The text (including
+# its indentation) is what ends up in the template, so keep it byte-for-byte stable;
+# only the allowedHosts array is filled in per distribution.
+_HOST_RESTRICTION_FUNCTION_CODE = """
+        function handler(event) {
+            var request = event.request;
+            var allowedHosts = %s;
+            var hostHeader = request.headers.host.value;
+            
+            // If the Host header is not in the allowed list, return a 403.
+            if (allowedHosts.indexOf(hostHeader) === -1) {
+                return { statusCode: 403, statusDescription: 'Forbidden' };
+            }
+            return request;
+        }
+        """
+
+
+# Actions the distribution's principal is granted on the source bucket
+_BUCKET_READ_ACTIONS = ("s3:GetObject", "s3:ListBucket")
+
+
 class CloudFrontDistributionConstruct(Construct):
     """
     CloudFrontDistributionConstruct is a construct that creates a CloudFront distribution for the given bucket.
     """
 
     AWS_HOSTED_ZONE_ID: str = "Z2FDTNDATAQYW2"
+    PARTITION_HOSTED_ZONE_IDS: Mapping[str, str] = MappingProxyType(
+        {"aws": AWS_HOSTED_ZONE_ID, "aws-cn": "Z3RFFRIM2A3IF5"}
+    )
 
     def __init__(
         self,
@@ -71,13 +97,33 @@ class CloudFrontDistributionConstruct(Construct):
     def hosted_zone_id(self) -> str:
         """
         Gets the AWS Hosted Zone ID for the distribution.
-        As of know, this value does not change
+        As of know, this value does not change.  It's a plain string (not a
+        token), so it can be used directly as the HostedZoneId of an alias
+        target without CDK adding a partition mapping to the template.
 
         Returns:
             str: hosted zone id
         """
         return CloudFrontDistributionConstruct.AWS_HOSTED_ZONE_ID
 
+    @classmethod
+    def hosted_zone_id_for_partition(cls, partition: str = "aws") -> str:
+        """
+        Gets the CloudFront Hosted Zone ID for a specific partition
+
+        Args:
+            partition (str): the AWS partition, e.g. "aws" or "aws-cn"
+
+        Returns:
+            str: hosted zone id
+        """
+        hosted_zone_id = cls.PARTITION_HOSTED_ZONE_IDS.get(partition)
+        if hosted_zone_id is None:
+            raise ValueError(
+                f"CloudFront hosted zone id is unknown for partition '{partition}'"
+            )
+        return hosted_zone_id
+
     def __validate_function_associations(self):
         """
         Validate CloudFront function association configuration.
@@ -165,11 +211,10 @@ class CloudFrontDistributionConstruct(Construct):
             self, "OAI", comment="OAI for accessing S3 bucket content securely"
         )
 
-        if isinstance(self.aliases, list):
-            if len(self.aliases) == 0:
-                self.aliases = None
+        # an empty alias list is treated the same as no aliases
+        self.aliases = self.aliases or None
 
-        if self.aliases and not isinstance(self.aliases, list):
+        if self.aliases is not None and not isinstance(self.aliases, list):
             raise ValueError("Aliases must be a list of strings or None")
 
     def create(self) -> cloudfront.Distribution:
@@ -530,19 +575,7 @@ class CloudFrontDistributionConstruct(Construct):
         allowed_hosts = "[" + ", ".join(f"'{host}'" for host in hosts) + "]"
 
         # Create the inline function code with the dynamic allowedHosts.
-        function_code = f"""
-        function handler(event) {{
-            var request = event.request;
-            var allowedHosts = {allowed_hosts};
-            var hostHeader = request.headers.host.value;
-            
-            // If the Host header is not in the allowed list, return a 403.
-            if (allowedHosts.indexOf(hostHeader) === -1) {{
-                return {{ statusCode: 403, statusDescription: 'Forbidden' }};
-            }}
-            return request;
-        }}
-        """
+        function_code = _HOST_RESTRICTION_FUNCTION_CODE % allowed_hosts
 
         restrict_function = cloudfront.Function(
             self,
@@ -617,7 +650,7 @@ class CloudFrontDistributionConstruct(Construct):
             iam.PolicyStatement: base policy statement
         """
         statement = iam.PolicyStatement(
-            actions=["s3:GetObject", "s3:ListBucket"],
+            actions=list(_BUCKET_READ_ACTIONS),
             resources=[
                 self.source_bucket.arn_for_objects("*"),
                 self.source_bucket.bucket_arn,
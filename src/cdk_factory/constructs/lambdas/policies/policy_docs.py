@@ -5,6 +5,7 @@ MIT License.  See Project Root for the license information.
 """
 
 from typing import Any, Dict, List, Optional
+import copy
 import hashlib
 import os
 import re
@@ -19,6 +20,139 @@ from cdk_factory.configurations.resources.lambda_function import (
     LambdaFunctionConfig,
 )
 
+# Permissions that take no resource target. They don't depend on the deployment,
+# so they're defined once; lookups hand out a copy so callers can't mutate them.
+_SIMPLE_PERMISSIONS: Dict[str, Dict[str, Any]] = {
+    "parameter_store_read": {
+        "name": "ssm",
+        "description": "Parameter Store Read",
+        "sid": "ParameterStoreRead",
+        "actions": [
+            "ssm:GetParameter",
+            "ssm:GetParameters",
+            "ssm:GetParametersByPath",
+            "ssm:DescribeParameters",
+        ],
+        "resources": ["*"],
+        "nag": {
+            "id": "AwsSolutions-IAM5",
+            "reason": "SSM parameter store read requires wildcard to discover parameters by path.",
+            "resources": ["Resource::*"],
+        },
+    },
+    "cognito_user_pool_read": {
+        "name": "Cognito",
+        "description": "Cognito User Pool Access",
+        "sid": "CognitoUserPoolAccess",
+        "actions": ["cognito-idp:ListUserPools"],
+        "resources": ["*"],
+    },
+    "cognito_user_pool_client_read": {
+        "name": "Cognito",
+        "description": "Cognito User Pool Client Access",
+        "sid": "CognitoUserPoolClientAccess",
+        "actions": ["cognito-idp:ListUserPoolClients"],
+        "resources": ["*"],
+    },
+    "cognito_user_pool_group_read": {
+        "name": "Cognito",
+        "description": "Cognito User Pool Group Access",
+        "sid": "CognitoUserPoolGroupAccess",
+        "actions": ["cognito-idp:ListGroups"],
+        "resources": ["*"],
+    },
+    "cognito_admin": {
+        "name": "Cognito",
+        "description": "Cognito Admin Access",
+        "sid": "CognitoAdminAccess",
+        "actions": ["cognito-idp:*"],
+        "resources": ["*"],
+        "nag": {
+            "id": "AwsSolutions-IAM5",
+            "reason": "Wildcard permission for cognito access.",
+            "resources": ["Resource::*", "Action::cognito-idp:*"],
+        },
+    },
+}
+
+
+# Action sets for the structured {"dynamodb": <action>, "table": ...} format
+_DYNAMODB_ACTIONS: Dict[str, Dict[str, Any]] = {
+    "read": {
+        "actions": [
+            "dynamodb:GetItem",
+            "dynamodb:Scan",
+            "dynamodb:Query",
+            "dynamodb:BatchGetItem",
+        ],
+        "sid": "DynamoDbRead",
+        "description": "DynamoDB Read",
+    },
+    "write": {
+        "actions": [
+            "dynamodb:BatchWriteItem",
+            "dynamodb:PutItem",
+            "dynamodb:UpdateItem",
+        ],
+        "sid": "DynamoDbWrite",
+        "description": "DynamoDB Write",
+    },
+    "delete": {
+        "actions": ["dynamodb:DeleteItem"],
+        "sid": "DynamoDbDelete",
+        "description": "DynamoDB Delete",
+    },
+}
+
+
+def _base_lambda_statements() -> List[iam.PolicyStatement]:
+    """
+    Statements every lambda gets (logs, metrics, x-ray). A fresh set is built
+    per policy since PolicyStatements are mutable and frozen at synthesis.
+    """
+    # Custom Policy for the Lambda Role
+    lambda_exec_policy_statements = iam.PolicyStatement(
+        actions=[
+            "logs:CreateLogGroup",
+            "logs:CreateLogStream",
+            "logs:PutLogEvents",
+        ],
+        resources=["arn:aws:logs:*:*:*"],
+        effect=iam.Effect.ALLOW,
+    )
+
+    lambda_insights_statements = iam.PolicyStatement(
+        actions=["cloudwatch:PutMetricData"],
+        resources=["*"],
+        effect=iam.Effect.ALLOW,
+    )
+
+    lambda_xray_permissions = iam.PolicyStatement(
+        sid="XrayPermissions",
+        actions=["xray:PutTraceSegments", "xray:PutTelemetryRecords"],
+        resources=["*"],
+        effect=iam.Effect.ALLOW,
+    )
+
+    return [
+        lambda_exec_policy_statements,
+        lambda_insights_statements,
+        lambda_xray_permissions,
+    ]
+
+
+# Wildcards in the default lambda policy (logging + put metric) that cdk_nag flags
+_DEFAULT_LAMBDA_NAG_SUPPRESSIONS = (
+    cdk_nag.NagPackSuppression(
+        id="AwsSolutions-IAM5",
+        reason="Not sure how to get rid of these errors",
+        applies_to=[
+            "Resource::arn:aws:logs:*:*:*",  # logging
+            "Resource::*",  # put metric
+        ],
+    ),
+)
+
 
 class ResourceResolver:
     """Flexible resource resolver that can load from environment variables or enhanced SSM parameters"""
@@ -108,6 +242,15 @@ class ResourceResolver:
 class PolicyDocuments:
     """Reusable Policy Statements"""
 
+    __slots__ = (
+        "scope",
+        "role",
+        "lambda_config",
+        "deployment",
+        "_resource_resolver",
+        "_base_name",
+    )
+
     def __init__(
         self,
         scope: Construct,
@@ -120,6 +263,16 @@ class PolicyDocuments:
         self.lambda_config: LambdaFunctionConfig = lambda_config
         self.deployment: Deployment = deployment
         self._resource_resolver = None
+        self._base_name: str | None = None
+
+    @property
+    def base_name(self) -> str:
+        """The deployment resource name for the lambda, used to name its policies"""
+        if self._base_name is None:
+            self._base_name = self.deployment.build_resource_name(
+                self.lambda_config.name
+            )
+        return self._base_name
 
     def _make_sid_slug(
         self, resource_name: str, extra_strip: dict | None = None
@@ -148,52 +301,17 @@ class PolicyDocuments:
 
     def default_lambda_policy_doc(self) -> iam.Policy:
         """Creates the default policy document"""
-        statements: List[iam.PolicyStatement] = []
-        # Custom Policy for the Lambda Role
-        lambda_exec_policy_statements = iam.PolicyStatement(
-            actions=[
-                "logs:CreateLogGroup",
-                "logs:CreateLogStream",
-                "logs:PutLogEvents",
-            ],
-            resources=["arn:aws:logs:*:*:*"],
-            effect=iam.Effect.ALLOW,
-        )
-        statements.append(lambda_exec_policy_statements)
-
-        lambda_insights_statements = iam.PolicyStatement(
-            actions=["cloudwatch:PutMetricData"],
-            resources=["*"],
-            effect=iam.Effect.ALLOW,
-        )
-        statements.append(lambda_insights_statements)
-
-        lambda_xray_permissions = iam.PolicyStatement(
-            sid="XrayPermissions",
-            actions=["xray:PutTraceSegments", "xray:PutTelemetryRecords"],
-            resources=["*"],
-            effect=iam.Effect.ALLOW,
-        )
-        statements.append(lambda_xray_permissions)
+        statements: List[iam.PolicyStatement] = _base_lambda_statements()
 
         policy = iam.Policy(
             scope=self.scope,
-            id=f"{self.deployment.build_resource_name(self.lambda_config.name)}-policy-doc",
+            id=f"{self.base_name}-policy-doc",
             statements=statements,
         )
 
         cdk_nag.NagSuppressions.add_resource_suppressions(
             construct=policy,
-            suppressions=[
-                cdk_nag.NagPackSuppression(
-                    id="AwsSolutions-IAM5",
-                    reason="Not sure how to get rid of these errors",
-                    applies_to=[
-                        "Resource::arn:aws:logs:*:*:*",  # logging
-                        "Resource::*",  # put metric
-                    ],
-                )
-            ],
+            suppressions=list(_DEFAULT_LAMBDA_NAG_SUPPRESSIONS),
             apply_to_children=True,
         )
 
@@ -204,59 +322,58 @@ class PolicyDocuments:
         policy_doc: iam.Policy = self.default_lambda_policy_doc()
         policy_doc.attach_to_role(self.role)
 
-        nag_exclusions = []
-
-        if self.lambda_config.permissions:
-            statements = []
-            for permission in self.lambda_config.permissions:
-                permission_details = self.get_permission_details(permission)
-                if permission_details is None:
-                    print(f"Permission set for {permission} not found")
-                    raise ValueError(
-                        f"Permission set for {permission} not found when attempting "
-                        "to generate permissions."
+        if not self.lambda_config.permissions:
+            return None
+
+        statements = []
+        suppressions: List[cdk_nag.NagPackSuppression] = []
+        allow = iam.Effect.ALLOW
+        for permission in self.lambda_config.permissions:
+            permission_details = self.get_permission_details(permission)
+            if permission_details is None:
+                print(f"Permission set for {permission} not found")
+                raise ValueError(
+                    f"Permission set for {permission} not found when attempting "
+                    "to generate permissions."
+                )
+            if not permission_details or "actions" not in permission_details:
+                # Empty permission (e.g., optional feature not configured) — skip
+                continue
+            statement = iam.PolicyStatement(
+                sid=permission_details.get("sid"),
+                actions=permission_details["actions"],
+                resources=permission_details["resources"],
+                # todo: change this to add it dynamically, we may want to deny
+                effect=allow,
+            )
+
+            statements.append(statement)
+            nag: dict | None = permission_details.get("nag")
+            if nag:
+                suppressions.append(
+                    cdk_nag.NagPackSuppression(
+                        id=nag["id"],
+                        reason=nag["reason"],
+                        applies_to=nag["resources"],
                     )
-                if not permission_details or "actions" not in permission_details:
-                    # Empty permission (e.g., optional feature not configured) — skip
-                    continue
-                statement = iam.PolicyStatement(
-                    sid=permission_details.get("sid"),
-                    actions=permission_details["actions"],
-                    resources=permission_details["resources"],
-                    # todo: change this to add it dynamically, we may want to deny
-                    effect=iam.Effect.ALLOW,
                 )
 
-                statements.append(statement)
-                if permission_details.get("nag"):
-                    nag_exclusions.append(permission_details.get("nag"))
+        if statements:
+            policy = iam.Policy(
+                self.scope,
+                id=f"{self.base_name}-resources-policy-doc",
+                statements=statements,
+            )
 
-            if len(statements) > 0:
-                policy = iam.Policy(
-                    self.scope,
-                    id=f"{self.deployment.build_resource_name(self.lambda_config.name)}-resources-policy-doc",
-                    statements=statements,
-                )
+            policy.attach_to_role(self.role)
 
-                policy.attach_to_role(self.role)
-
-            if len(nag_exclusions) > 0:
-                nag: dict | None = None
-                for nag in nag_exclusions:
-                    if nag is None:
-                        continue
-
-                    cdk_nag.NagSuppressions.add_resource_suppressions(
-                        construct=policy,
-                        suppressions=[
-                            cdk_nag.NagPackSuppression(
-                                id=nag["id"],
-                                reason=nag["reason"],
-                                applies_to=nag["resources"],
-                            )
-                        ],
-                        apply_to_children=True,
-                    )
+            if suppressions:
+                # one call for all of the permission suppressions
+                cdk_nag.NagSuppressions.add_resource_suppressions(
+                    construct=policy,
+                    suppressions=suppressions,
+                    apply_to_children=True,
+                )
 
         return None
 
@@ -389,43 +506,8 @@ class PolicyDocuments:
         """
         # --- String permissions (no resource target) ---
         if isinstance(permission, str):
-            simple_permissions = {
-                "parameter_store_read": self.__get_parameter_store_read_permissions(),
-                "cognito_user_pool_read": {
-                    "name": "Cognito",
-                    "description": "Cognito User Pool Access",
-                    "sid": "CognitoUserPoolAccess",
-                    "actions": ["cognito-idp:ListUserPools"],
-                    "resources": ["*"],
-                },
-                "cognito_user_pool_client_read": {
-                    "name": "Cognito",
-                    "description": "Cognito User Pool Client Access",
-                    "sid": "CognitoUserPoolClientAccess",
-                    "actions": ["cognito-idp:ListUserPoolClients"],
-                    "resources": ["*"],
-                },
-                "cognito_user_pool_group_read": {
-                    "name": "Cognito",
-                    "description": "Cognito User Pool Group Access",
-                    "sid": "CognitoUserPoolGroupAccess",
-                    "actions": ["cognito-idp:ListGroups"],
-                    "resources": ["*"],
-                },
-                "cognito_admin": {
-                    "name": "Cognito",
-                    "description": "Cognito Admin Access",
-                    "sid": "CognitoAdminAccess",
-                    "actions": ["cognito-idp:*"],
-                    "resources": ["*"],
-                    "nag": {
-                        "id": "AwsSolutions-IAM5",
-                        "reason": "Wildcard permission for cognito access.",
-                        "resources": ["Resource::*", "Action::cognito-idp:*"],
-                    },
-                },
-            }
-            return simple_permissions.get(permission, {})
+            details = _SIMPLE_PERMISSIONS.get(permission)
+            return copy.deepcopy(details) if details else {}
 
         # --- Dict permissions ---
         if isinstance(permission, dict):
@@ -480,44 +562,17 @@ class PolicyDocuments:
                 )
                 return None
 
-            action_map = {
-                "read": {
-                    "actions": [
-                        "dynamodb:GetItem",
-                        "dynamodb:Scan",
-                        "dynamodb:Query",
-                        "dynamodb:BatchGetItem",
-                    ],
-                    "sid": "DynamoDbRead",
-                    "description": "DynamoDB Read",
-                },
-                "write": {
-                    "actions": [
-                        "dynamodb:BatchWriteItem",
-                        "dynamodb:PutItem",
-                        "dynamodb:UpdateItem",
-                    ],
-                    "sid": "DynamoDbWrite",
-                    "description": "DynamoDB Write",
-                },
-                "delete": {
-                    "actions": ["dynamodb:DeleteItem"],
-                    "sid": "DynamoDbDelete",
-                    "description": "DynamoDB Delete",
-                },
-            }
-
-            if action not in action_map:
+            if action not in _DYNAMODB_ACTIONS:
                 raise ValueError(
-                    f"Unknown DynamoDB action '{action}'. Valid: {list(action_map.keys())}"
+                    f"Unknown DynamoDB action '{action}'. Valid: {list(_DYNAMODB_ACTIONS.keys())}"
                 )
 
             # Make SID unique per table to avoid collisions
             table_slug = self._make_sid_slug(table)
-            details = action_map[action]
+            details = _DYNAMODB_ACTIONS[action]
             return self._dynamodb_permissions(
                 table_name=table,
-                actions=details["actions"],
+                actions=list(details["actions"]),
                 sid=f"{details['sid']}{table_slug}",
                 description=f"{details['description']} on {table}",
             )
@@ -942,29 +997,6 @@ class PolicyDocuments:
 
         return policy
 
-    def __get_parameter_store_read_permissions(self) -> dict:
-        """Returns the necessary permissions for the parameter store"""
-
-        permission: Dict[str, Any] = {
-            "name": "ssm",
-            "description": "Parameter Store Read",
-            "sid": "ParameterStoreRead",
-            "actions": [
-                "ssm:GetParameter",
-                "ssm:GetParameters",
-                "ssm:GetParametersByPath",
-                "ssm:DescribeParameters",
-            ],
-            "resources": ["*"],
-            "nag": {
-                "id": "AwsSolutions-IAM5",
-                "reason": "SSM parameter store read requires wildcard to discover parameters by path.",
-                "resources": ["Resource::*"],
-            },
-        }
-
-        return permission
-
     def get_permission_details_from_dict(self, permission: dict) -> dict:
         """Returns the details of a specific permission"""
 
@@ -972,16 +1004,12 @@ class PolicyDocuments:
         actions = permission.get("actions", [])
 
         if "lambda:InvokeFunction" in actions:
-            tmp = []
-            for resource in resources:
-                function_name = self.deployment.build_resource_name(
-                    resource, ResourceTypes.LAMBDA_FUNCTION
-                )
-                tmp.append(
-                    f"arn:aws:lambda:{self.deployment.region}:{self.deployment.account}:function:{function_name}"
-                )
-
-            resources = tmp
+            build_resource_name = self.deployment.build_resource_name
+            arn_prefix = f"arn:aws:lambda:{self.deployment.region}:{self.deployment.account}:function:"
+            resources = [
+                f"{arn_prefix}{build_resource_name(resource, ResourceTypes.LAMBDA_FUNCTION)}"
+                for resource in resources
+            ]
 
         permission_details = {
             "name": permission.get("name"),
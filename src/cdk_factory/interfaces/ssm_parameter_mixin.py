@@ -8,10 +8,17 @@ from typing import Dict, Any, Optional
 from aws_cdk import aws_ssm as ssm
 from constructs import Construct
 from aws_lambda_powertools import Logger
+from cdk_factory.configurations.base_config import NO_SSM_CONFIG
 
 logger = Logger(__name__)
 
 
+class SsmConfigError(ValueError):
+    """Raised when an SSM export configuration doesn't match the resource values."""
+
+    pass
+
+
 class SsmParameterMixin:
     """
     A mixin class that provides SSM parameter export and import functionality
@@ -147,15 +154,27 @@ class SsmParameterMixin:
 
         Returns:
             Dictionary of created SSM parameters
+
+        Raises:
+            SsmConfigError: If ssm_config has keys that aren't in config_dict
         """
+        # missing or misspelled keys
+        missing_keys = [key for key in ssm_config if key not in config_dict]
+        if missing_keys:
+            logger.warning(f"Missing keys: {missing_keys}")
+            message = (
+                "🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨"
+                f"\nThe following keys are missing from the config dictionary: {missing_keys}."
+                f"\nThe accepted keys are: {list(config_dict.keys())}."
+                "\nPlease check your configuration.  Some keys may be misspelled."
+                "\n🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨"
+            )
+            logger.error(message.replace("\n", ""))
+            raise SsmConfigError(message)
+
         parameters = {}
-        missing_keys = []
+        export = self.export_ssm_parameter
         for key, path in ssm_config.items():
-            if key not in config_dict:
-                # missing or misspelled key
-                missing_keys.append(key)
-                continue
-
             if not path:
                 # nothing configured for this key which is acceptable
                 continue
@@ -163,7 +182,7 @@ class SsmParameterMixin:
             value = str(config_dict[key])
             id_name = f"{resource}{key.replace('_', '-')}-param"
 
-            param = self.export_ssm_parameter(
+            param = export(
                 scope=scope,
                 id=id_name,
                 value=value,
@@ -174,20 +193,6 @@ class SsmParameterMixin:
             if param:
                 parameters[key] = param
 
-        if missing_keys:
-            logger.warning(f"Missing keys: {missing_keys}")
-            # TODO : throw an exception here?
-            message = (
-                "🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨"
-                f"\nThe following keys are missing from the config dictionary: {missing_keys}."
-                f"\nThe accepted keys are: {list(config_dict.keys())}."
-                "\nPlease check your configuration.  Some keys may be misspelled."
-                "\n🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨"
-            )
-            print(message)
-            logger.error(message.replace("\n", ""))
-            exit(1)
-
         return parameters
 
     def export_resource_to_ssm(
@@ -217,11 +222,11 @@ class SsmParameterMixin:
             Dictionary of created SSM parameters
         """
         # First try the new ssm_exports property
-        ssm_config = getattr(config, "ssm_exports", {})
+        ssm_config = getattr(config, "ssm_exports", NO_SSM_CONFIG)
 
         # If empty, fall back to the legacy ssm_parameters for backward compatibility
         if not ssm_config:
-            ssm_config = getattr(config, "ssm_parameters", {})
+            ssm_config = getattr(config, "ssm_parameters", NO_SSM_CONFIG)
 
         # Export all resources to SSM if paths are configured
         if ssm_config:
@@ -284,11 +289,11 @@ class SsmParameterMixin:
             Dictionary of imported SSM parameter values
         """
         # First try the new ssm_imports property
-        ssm_config = getattr(config, "ssm_imports", {})
+        ssm_config = getattr(config, "ssm_imports", NO_SSM_CONFIG)
 
         # If empty, fall back to the legacy ssm_parameters for backward compatibility
         if not ssm_config:
-            ssm_config = getattr(config, "ssm_parameters", {})
+            ssm_config = getattr(config, "ssm_parameters", NO_SSM_CONFIG)
 
         imported_values = {}
 
@@ -319,10 +324,8 @@ class SsmParameterMixin:
                 )
 
                 if value:
-                    # Remove _path suffix if present
-                    if key.endswith("_path"):
-                        key = key[:-5]  # Remove _path suffix
-                    imported_values[key] = value
+                    # Stored without the _path suffix
+                    imported_values[attr_name] = value
         else:
             logger.info(f"No SSM import paths configured for {resource_name} resources")
 
@@ -64,6 +64,9 @@ class StandardizedSsmMixin:
     - List parameter support (for security groups, etc.)
     - Cached imported values for easy access
     - Backward compatibility with existing interfaces
+
+    Imported values are keyed by the (string) import names from the config;
+    keep it that way so lookups stay on the str-only dict fast path.
     """
 
     def __init__(self, *args, **kwargs):
@@ -72,6 +75,8 @@ class StandardizedSsmMixin:
         # Initialize cached storage for imported values
         self._ssm_imported_values: Dict[str, Union[str, List[str]]] = {}
         self._ssm_exported_values: Dict[str, str] = {}
+        # SSM path -> token, so a path referenced more than once is imported once
+        self._ssm_path_tokens: Dict[str, str] = {}
 
     # Backward compatibility methods from old SsmParameterMixin
     def get_ssm_imported_value(self, key: str, default: Any = None) -> Any:
@@ -204,6 +209,8 @@ class StandardizedSsmMixin:
         # Initialize SSM storage
         self._ssm_imported_values: Dict[str, Union[str, List[str]]] = {}
         self._ssm_exported_values: Dict[str, str] = {}
+        # SSM path -> token, so a path referenced more than once is imported once
+        self._ssm_path_tokens: Dict[str, str] = {}
 
         # Extract SSM configuration
         self.ssm_config = self.config_dict.get("ssm", {})
@@ -239,10 +246,11 @@ class StandardizedSsmMixin:
             f"Processing {len(imports)} SSM imports for {self.resource_type}/{self.resource_name}"
         )
 
+        imported_values = self._ssm_imported_values
+        resolve_import = self._resolve_ssm_import
         for import_key, import_value in imports.items():
             try:
-                resolved_value = self._resolve_ssm_import(import_value, import_key)
-                self._ssm_imported_values[import_key] = resolved_value
+                imported_values[import_key] = resolve_import(import_value, import_key)
                 logger.info(f"Successfully imported SSM parameter: {import_key}")
             except Exception as e:
                 error_msg = f"Failed to import SSM parameter {import_key}: {str(e)}"
@@ -392,13 +400,11 @@ class StandardizedSsmMixin:
         """
         if isinstance(import_value, list):
             # Handle list imports (like security group IDs)
-            resolved_list = []
-            for i, value in enumerate(import_value):
-                resolved_item = self._resolve_single_ssm_import(
-                    value, f"{import_key}[{i}]"
-                )
-                resolved_list.append(resolved_item)
-            return resolved_list
+            resolve_single = self._resolve_single_ssm_import
+            return [
+                resolve_single(value, f"{import_key}[{i}]")
+                for i, value in enumerate(import_value)
+            ]
         else:
             # Handle single imports
             return self._resolve_single_ssm_import(import_value, import_key)
@@ -420,6 +426,10 @@ class StandardizedSsmMixin:
         # Validate path format
         self._validate_ssm_path(resolved_path, context)
 
+        token = self._ssm_path_tokens.get(resolved_path)
+        if token is not None:
+            return token
+
         # Create CDK SSM parameter reference
         construct_id = (
             f"import-{context.replace('.', '-').replace('[', '-').replace(']', '-')}"
@@ -429,7 +439,9 @@ class StandardizedSsmMixin:
         )
 
         # Return the CDK token (will resolve at deployment time)
-        return param.string_value
+        token = param.string_value
+        self._ssm_path_tokens[resolved_path] = token
+        return token
 
     def _resolve_template_variables(self, template_string: str) -> str:
         """
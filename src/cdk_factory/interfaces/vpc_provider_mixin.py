@@ -8,6 +8,7 @@ from typing import Optional, List, Any
 from aws_lambda_powertools import Logger
 from aws_cdk import aws_ec2 as ec2, aws_ssm as ssm
 from constructs import Construct
+from cdk_factory.configurations.base_config import NO_SSM_CONFIG
 
 logger = Logger(__name__)
 
@@ -69,8 +70,7 @@ class VPCProviderMixin:
             availability_zones = self._get_default_azs_for_region(region)
 
         # Check SSM imports directly from config (source of truth)
-        ssm_config = getattr(config, 'ssm', {})
-        ssm_imports = ssm_config.get('imports', {})
+        ssm_imports = getattr(config, 'ssm', NO_SSM_CONFIG).get('imports', NO_SSM_CONFIG)
         
         if ssm_imports and "vpc_id" in ssm_imports:
             vpc_id = ssm_imports["vpc_id"]
@@ -143,7 +143,7 @@ class EcsServiceStack(IStack, VPCProviderMixin, StandardizedSsmMixin):
                         if not param_path.startswith('/'):
                             param_path = f"/{param_path}"
                         
-                        construct_id = f"ssm-import-{param_key}-{idx}-{hash(param_path) % 10000}"
+                        construct_id = f"ssm-import-{param_key}-{idx}"
                         param = ssm.StringParameter.from_string_parameter_name(
                             self, construct_id, param_path
                         )
@@ -157,7 +157,7 @@ class EcsServiceStack(IStack, VPCProviderMixin, StandardizedSsmMixin):
                     if not param_path.startswith('/'):
                         param_path = f"/{param_path}"
                     
-                    construct_id = f"ssm-import-{param_key}-{hash(param_path) % 10000}"
+                    construct_id = f"ssm-import-{param_key}"
                     param = ssm.StringParameter.from_string_parameter_name(
                         self, construct_id, param_path
                     )
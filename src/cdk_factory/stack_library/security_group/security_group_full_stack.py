@@ -227,8 +227,8 @@ class SecurityGroupsStack(IStack, VPCProviderMixin):
                 if not param_path.startswith('/'):
                     param_path = f"/{param_path}"
                 
-                # Create unique construct ID from parameter path
-                construct_id = f"ssm-import-{param_key}-{hash(param_path) % 10000}"
+                # Construct ID from the (unique) import key so it is stable across synths
+                construct_id = f"ssm-import-{param_key}"
                 
                 # Import SSM parameter - this creates a CDK token that resolves at deployment time
                 param = ssm.StringParameter.from_string_parameter_name(
@@ -7,9 +7,15 @@ MIT License.  See Project Root for the license information.
 import copy
 import json
 import os
+import re
 import sys
 from typing import Any, Dict
 
+try:  # optional: orjson parses/serializes large configs several times faster
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson isn't installed
+    orjson = None
+
 
 class JsonLoadingUtility:
     """
@@ -61,6 +67,14 @@ class JsonLoadingUtility:
                     f"  config.json. Check that the path is correct and the file exists.\n"
                 )
                 sys.exit(1)
+            if orjson is not None:
+                with open(path, "rb") as f:
+                    raw = f.read()
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # stdlib is more lenient (NaN, big ints) and gives the familiar error
+                    pass
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         else:
@@ -264,9 +278,31 @@ class JsonLoadingUtility:
 
     @staticmethod
     def save(config: dict, path: str):
-        """Save a configuration dictionary to a JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        """Save a configuration dictionary to a JSON file.
+
+        The write is skipped when the file already holds identical content,
+        so repeated synths don't rewrite (and re-timestamp) unchanged files.
+        """
+        content = JsonLoadingUtility.__dumps(config)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return
+        with open(path, "wb") as f:
+            f.write(content)
+
+    @staticmethod
+    def __dumps(config: dict) -> bytes:
+        """Serialize to indented UTF-8 JSON, using orjson when it's installed."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                # e.g. ints beyond 64 bits; fall back to the stdlib encoder
+                pass
+        return json.dumps(config, indent=2).encode("utf-8")
 
     @staticmethod
     def recursive_replace(data: dict | list | str, replacements: Dict[str, Any]):
@@ -284,28 +320,41 @@ class JsonLoadingUtility:
             }
         :return: A new data structure with the replacements applied.
         """
+        # One alternation over every placeholder (longest first), so each
+        # string is scanned once instead of once per replacement
+        pattern = (
+            re.compile(
+                "|".join(
+                    re.escape(find_str)
+                    for find_str in sorted(replacements, key=len, reverse=True)
+                )
+            )
+            if replacements
+            else None
+        )
+        return JsonLoadingUtility.__replace(data, pattern, replacements)
+
+    @staticmethod
+    def __replace(data: Any, pattern: re.Pattern | None, replacements: Dict[str, Any]):
+        """Walk the structure applying the compiled placeholder pattern"""
         if isinstance(data, dict):
-            result = {}
-            for k, v in data.items():
-                # Replace placeholders in the key if it's a string
-                new_key = k
-                if isinstance(k, str):
-                    for find_str, replace_str in replacements.items():
-                        new_key = new_key.replace(find_str, replace_str)
-
-                # Recursively process the value
-                new_value = JsonLoadingUtility.recursive_replace(v, replacements)
-                result[new_key] = new_value
-            return result
+            return {
+                (
+                    JsonLoadingUtility.__replace(k, pattern, replacements)
+                    if isinstance(k, str)
+                    else k
+                ): JsonLoadingUtility.__replace(v, pattern, replacements)
+                for k, v in data.items()
+            }
         elif isinstance(data, list):
             return [
-                JsonLoadingUtility.recursive_replace(item, replacements)
+                JsonLoadingUtility.__replace(item, pattern, replacements)
                 for item in data
             ]
         elif isinstance(data, str):
-            for find_str, replace_str in replacements.items():
-                data = data.replace(find_str, replace_str)
-            return data
+            if pattern is None:
+                return data
+            return pattern.sub(lambda m: replacements[m.group(0)], data)
         else:
             # Return the data unchanged if it's not a dict, list, or string.
             return data
@@ -0,0 +1,28 @@
+"""
+Geek Cafe, LLC
+Maintainers: Eric Wilson
+MIT License.  See Project Root for the license information.
+"""
+
+import re
+from typing import Callable, Optional
+
+# ${NAME} placeholders; NAME must be an identifier (e.g. ENVIRONMENT, SECURITY_GROUP_ID)
+PLACEHOLDER_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def expand_placeholders(value: str, lookup: Callable[[str], Optional[str]]) -> str:
+    """
+    Replace every ${NAME} placeholder in value in a single scan.
+
+    lookup is called with each NAME; placeholders it returns None for are left
+    as-is. Raise from lookup to treat a missing name as an error.
+    """
+    if "${" not in value:
+        return value
+
+    def replace(match: "re.Match[str]") -> str:
+        resolved = lookup(match.group(1))
+        return match.group(0) if resolved is None else resolved
+
+    return PLACEHOLDER_RE.sub(replace, value)
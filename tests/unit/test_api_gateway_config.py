@@ -0,0 +1,19 @@
+"""
+Unit tests for ApiGatewayConfig api_type property.
+"""
+
+from cdk_factory.configurations.resources.api_gateway import ApiGatewayConfig
+
+
+class TestApiGatewayConfigApiType:
+    """Test ApiGatewayConfig api_type normalization."""
+
+    def test_api_type_defaults_to_rest(self):
+        """Verify api_type defaults to REST when absent."""
+        assert ApiGatewayConfig(config={"name": "test-api"}).api_type == "REST"
+        assert ApiGatewayConfig().api_type == "REST"
+
+    def test_api_type_is_upper_cased(self):
+        """Verify api_type is normalized to upper case."""
+        config = ApiGatewayConfig(config={"name": "test-api", "api_type": "http"})
+        assert config.api_type == "HTTP"
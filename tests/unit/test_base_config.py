@@ -0,0 +1,92 @@
+"""Unit tests for BaseConfig"""
+
+import unittest
+
+from cdk_factory.configurations.base_config import BaseConfig
+
+
+class TestBaseConfigSsmPaths(unittest.TestCase):
+    """Test cases for BaseConfig SSM path lookups"""
+
+    def test_get_ssm_path_precedence(self):
+        """Exports win over imports, which win over legacy ssm_parameters"""
+        config = BaseConfig(
+            {
+                "ssm": {
+                    "exports": {"vpc_id_path": "/exports/vpc-id"},
+                    "imports": {
+                        "vpc_id_path": "/imports/vpc-id",
+                        "subnet_ids_path": "/imports/subnet-ids",
+                    },
+                },
+                "ssm_parameters": {
+                    "subnet_ids_path": "/legacy/subnet-ids",
+                    "bucket_name_path": "/legacy/bucket-name",
+                },
+            }
+        )
+
+        self.assertEqual(config.get_ssm_path("vpc_id"), "/exports/vpc-id")
+        self.assertEqual(config.get_ssm_path("subnet_ids"), "/imports/subnet-ids")
+        self.assertEqual(config.get_ssm_path("bucket_name"), "/legacy/bucket-name")
+        self.assertIsNone(config.get_ssm_path("missing"))
+
+    def test_get_ssm_path_empty_value_falls_through(self):
+        """An empty export does not shadow a configured import"""
+        config = BaseConfig(
+            {
+                "ssm": {
+                    "exports": {"vpc_id_path": ""},
+                    "imports": {"vpc_id_path": "/imports/vpc-id"},
+                }
+            }
+        )
+
+        self.assertEqual(config.get_ssm_path("vpc_id"), "/imports/vpc-id")
+
+    def test_ssm_exports_and_imports_are_cached(self):
+        """Repeated access returns the same dictionaries"""
+        config = BaseConfig({"ssm": {"exports": {}, "imports": {}}})
+
+        self.assertIs(config.ssm_exports, config.ssm_exports)
+        self.assertIs(config.ssm_imports, config.ssm_imports)
+
+    def test_get_ssm_path_without_ssm_config(self):
+        """Configs without SSM settings return None"""
+        config = BaseConfig({"name": "no-ssm"})
+
+        self.assertIsNone(config.get_ssm_path("vpc_id"))
+        self.assertIsNone(config.get_ssm_path("vpc_id", resource_type="vpc"))
+
+    def test_get_export_and_import_path(self):
+        """Export/import lookups read the matching ssm section only"""
+        config = BaseConfig(
+            {
+                "ssm": {
+                    "exports": {"vpc_id_path": "/exports/vpc-id"},
+                    "imports": {"subnet_ids_path": "/imports/subnet-ids"},
+                }
+            }
+        )
+
+        self.assertEqual(config.get_export_path("vpc_id"), "/exports/vpc-id")
+        self.assertIsNone(config.get_export_path("subnet_ids"))
+        self.assertEqual(config.get_import_path("subnet_ids"), "/imports/subnet-ids")
+        self.assertIsNone(config.get_import_path("vpc_id"))
+
+    def test_get_export_and_import_path_without_ssm_config(self):
+        """Configs without an ssm section have no export/import paths"""
+        config = BaseConfig({"name": "no-ssm"})
+
+        self.assertIsNone(config.get_export_path("vpc_id", resource_type="vpc"))
+        self.assertIsNone(config.get_import_path("vpc_id", resource_type="vpc"))
+
+    def test_get_ssm_path_legacy_parameters_only(self):
+        """Legacy ssm_parameters are still used when there is no ssm block"""
+        config = BaseConfig({"ssm_parameters": {"vpc_id_path": "/legacy/vpc-id"}})
+
+        self.assertEqual(config.get_ssm_path("vpc_id"), "/legacy/vpc-id")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Unit tests for CdkConfig config snapshot writes"""
+
+import json
+import os
+
+from cdk_factory.configurations.cdk_config import CdkConfig
+from cdk_factory.utilities.json_loading_utility import JsonLoadingUtility
+
+
+def _write_config(tmp_path, content):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(content))
+    return str(config_file)
+
+
+def test_save_skips_identical_content(tmp_path):
+    """JsonLoadingUtility.save leaves an identical file untouched"""
+    target = str(tmp_path / "out.json")
+    JsonLoadingUtility.save({"a": 1}, target)
+    os.utime(target, ns=(1, 1))
+
+    JsonLoadingUtility.save({"a": 1}, target)
+    assert os.stat(target).st_mtime_ns == 1
+
+    JsonLoadingUtility.save({"a": 2}, target)
+    assert os.stat(target).st_mtime_ns != 1
+    with open(target, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 2}
+
+
+def test_config_snapshots_written_by_default(tmp_path, monkeypatch):
+    """The .dynamic/ snapshots are written unless disabled"""
+    monkeypatch.delenv("CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT", raising=False)
+    config_path = _write_config(tmp_path, {"workload": {"name": "snap"}})
+
+    config = CdkConfig(config_path, {}, str(tmp_path))
+    config.save_config_snapshot()
+
+    assert (tmp_path / ".dynamic" / "config.json").exists()
+    assert (tmp_path / ".dynamic" / "runtime.config.json").exists()
+
+
+def test_config_snapshots_can_be_disabled(tmp_path, monkeypatch):
+    """CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT=1 skips all snapshot writes"""
+    monkeypatch.setenv("CDK_FACTORY_DISABLE_CONFIG_SNAPSHOT", "1")
+    config_path = _write_config(tmp_path, {"workload": {"name": "no-snap"}})
+
+    config = CdkConfig(config_path, {}, str(tmp_path))
+    config.save_config_snapshot()
+
+    assert config.config["workload"]["name"] == "no-snap"
+    assert not (tmp_path / ".dynamic").exists()
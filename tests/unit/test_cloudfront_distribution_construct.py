@@ -0,0 +1,56 @@
+"""
+Unit tests for CloudFrontDistributionConstruct helpers
+"""
+
+import pytest
+import aws_cdk as cdk
+from aws_cdk import aws_s3 as s3
+
+from cdk_factory.constructs.cloudfront.cloudfront_distribution_construct import (
+    CloudFrontDistributionConstruct,
+)
+
+
+class TestCloudFrontHostedZoneId:
+    """Test the CloudFront alias-target hosted zone ids"""
+
+    def test_default_partition(self):
+        assert (
+            CloudFrontDistributionConstruct.hosted_zone_id_for_partition()
+            == CloudFrontDistributionConstruct.AWS_HOSTED_ZONE_ID
+        )
+
+    def test_china_partition(self):
+        assert (
+            CloudFrontDistributionConstruct.hosted_zone_id_for_partition("aws-cn")
+            == "Z3RFFRIM2A3IF5"
+        )
+
+    def test_unknown_partition_raises(self):
+        with pytest.raises(ValueError, match="aws-us-gov"):
+            CloudFrontDistributionConstruct.hosted_zone_id_for_partition("aws-us-gov")
+
+
+class TestCloudFrontDistributionAliases:
+    """Test alias normalization when the construct is set up"""
+
+    @pytest.fixture
+    def stack(self):
+        return cdk.Stack(cdk.App(), "TestStack")
+
+    @pytest.fixture
+    def bucket(self, stack):
+        return s3.Bucket(stack, "SourceBucket")
+
+    def test_empty_aliases_become_none(self, stack, bucket):
+        construct = CloudFrontDistributionConstruct(
+            stack, "Distribution", source_bucket=bucket, aliases=[]
+        )
+
+        assert construct.aliases is None
+
+    def test_aliases_must_be_a_list(self, stack, bucket):
+        with pytest.raises(ValueError, match="Aliases must be a list"):
+            CloudFrontDistributionConstruct(
+                stack, "Distribution", source_bucket=bucket, aliases="example.com"
+            )
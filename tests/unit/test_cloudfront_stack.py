@@ -522,6 +522,48 @@ class TestCloudFrontStack:
             },
         )
 
+    def test_cloudfront_ssm_import_ids_are_stable(
+        self, app, deployment_config, workload_config
+    ):
+        """SSM import construct ids come from the import key, not a hash"""
+        stack_config = StackConfig(
+            {
+                "cloudfront": {
+                    "name": "ssm-import-distribution",
+                    "origins": [
+                        {
+                            "id": "ssm-origin",
+                            "type": "custom",
+                            "domain_name": "ssm.example.com",
+                        }
+                    ],
+                    "default_cache_behavior": {
+                        "target_origin_id": "ssm-origin",
+                    },
+                    "ssm": {
+                        "imports": {
+                            "web_acl_arn": "test/waf/web-acl-arn",
+                        },
+                    },
+                }
+            },
+            workload=workload_config.dictionary,
+        )
+
+        stack = CloudFrontStack(
+            app,
+            "TestSSMImports",
+            env=cdk.Environment(account="123456789012", region="us-east-1"),
+        )
+        stack.build(
+            stack_config=stack_config,
+            deployment=deployment_config,
+            workload=workload_config,
+        )
+
+        assert stack.node.try_find_child("ssm-import-web_acl_arn") is not None
+        assert "web_acl_arn" in stack.ssm_imported_values
+
     def test_cloudfront_requires_origins(self, app, deployment_config, workload_config):
         """Test that CloudFront requires at least one origin"""
         stack_config = StackConfig(
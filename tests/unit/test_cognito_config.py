@@ -0,0 +1,61 @@
+"""Unit tests for CognitoConfig"""
+
+import ast
+import inspect
+import unittest
+from collections import Counter
+
+from cdk_factory.configurations.resources import cognito
+from cdk_factory.configurations.resources.cognito import CognitoConfig
+
+
+class TestCognitoConfig(unittest.TestCase):
+    """Test cases for CognitoConfig"""
+
+    def test_no_duplicate_property_definitions(self):
+        """Each property is defined once; a later copy would silently shadow the first"""
+        module = ast.parse(inspect.getsource(cognito))
+        class_def = next(
+            node
+            for node in module.body
+            if isinstance(node, ast.ClassDef) and node.name == "CognitoConfig"
+        )
+        names = Counter(
+            node.name for node in class_def.body if isinstance(node, ast.FunctionDef)
+        )
+
+        duplicates = [name for name, count in names.items() if count > 1]
+        self.assertEqual(duplicates, [])
+
+    def test_defaults(self):
+        """Previously duplicated properties keep their defaults"""
+        config = CognitoConfig({"name": "pool"})
+
+        self.assertEqual(config.removal_policy, "RETAIN")
+        self.assertIsNone(config.password_policy)
+        self.assertIsNone(config.standard_attributes)
+        self.assertIsNone(config.user_invitation)
+        self.assertIsNone(config.user_verification)
+
+    def test_values_from_config(self):
+        """Previously duplicated properties read from the config"""
+        config = CognitoConfig(
+            {
+                "name": "pool",
+                "removal_policy": "DESTROY",
+                "password_policy": {"min_length": 12},
+                "standard_attributes": {"email": {"required": True}},
+                "user_invitation": {"email_subject": "Welcome"},
+                "user_verification": {"email_subject": "Verify"},
+            }
+        )
+
+        self.assertEqual(config.removal_policy, "DESTROY")
+        self.assertEqual(config.password_policy, {"min_length": 12})
+        self.assertEqual(config.standard_attributes, {"email": {"required": True}})
+        self.assertEqual(config.user_invitation, {"email_subject": "Welcome"})
+        self.assertEqual(config.user_verification, {"email_subject": "Verify"})
+
+
+if __name__ == "__main__":
+    unittest.main()
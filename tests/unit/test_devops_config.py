@@ -0,0 +1,31 @@
+"""Unit tests for DevOps configuration"""
+
+import unittest
+
+from cdk_factory.configurations.devops import DevOps
+
+
+class TestDevOpsCodeRepository(unittest.TestCase):
+    """Test cases for DevOps.code_repository"""
+
+    def test_code_repository_built_once(self):
+        """The validated code repository config is reused"""
+        devops = DevOps({"code_repository": {"name": "repo", "type": "code_commit"}})
+
+        code_repository = devops.code_repository
+
+        self.assertEqual(code_repository.name, "repo")
+        self.assertIs(devops.code_repository, code_repository)
+
+    def test_missing_repository_raises_on_every_access(self):
+        """An invalid config is not cached, so every access raises"""
+        devops = DevOps({"code_repository": {}})
+
+        with self.assertRaises(ValueError):
+            _ = devops.code_repository
+        with self.assertRaises(ValueError):
+            _ = devops.code_repository
+
+
+if __name__ == "__main__":
+    unittest.main()
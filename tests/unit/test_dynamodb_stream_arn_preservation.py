@@ -131,65 +131,65 @@ class TestPreservationAutoExports:
     """
 
     def test_vpc_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["vpc"] == [
+        assert RESOURCE_AUTO_EXPORTS["vpc"] == (
             "vpc_id",
             "vpc_cidr",
             "public_subnet_ids",
             "private_subnet_ids",
             "isolated_subnet_ids",
-        ]
+        )
 
     def test_rds_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["rds"] == [
+        assert RESOURCE_AUTO_EXPORTS["rds"] == (
             "db_instance_id",
             "db_endpoint",
             "db_port",
             "db_secret_arn",
-        ]
+        )
 
     def test_lambda_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["lambda"] == [
+        assert RESOURCE_AUTO_EXPORTS["lambda"] == (
             "function_name",
             "function_arn",
-        ]
+        )
 
     def test_s3_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["s3"] == [
+        assert RESOURCE_AUTO_EXPORTS["s3"] == (
             "bucket_name",
             "bucket_arn",
-        ]
+        )
 
     def test_cognito_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["cognito"] == [
+        assert RESOURCE_AUTO_EXPORTS["cognito"] == (
             "user_pool_id",
             "user_pool_arn",
             "user_pool_name",
             "user_pool_client_id",
             "authorizer_id",
-        ]
+        )
 
     def test_api_gateway_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["api_gateway"] == [
+        assert RESOURCE_AUTO_EXPORTS["api_gateway"] == (
             "api_id",
             "api_arn",
             "api_url",
             "root_resource_id",
             "authorizer_id",
-        ]
+        )
 
     def test_api_gateway_hyphen_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["api-gateway"] == [
+        assert RESOURCE_AUTO_EXPORTS["api-gateway"] == (
             "api_id",
             "api_arn",
             "api_url",
             "root_resource_id",
             "authorizer_id",
-        ]
+        )
 
     def test_security_group_auto_exports_unchanged(self):
-        assert RESOURCE_AUTO_EXPORTS["security_group"] == [
+        assert RESOURCE_AUTO_EXPORTS["security_group"] == (
             "security_group_id",
-        ]
+        )
 
 
 # ---------------------------------------------------------------------------
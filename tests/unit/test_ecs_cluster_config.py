@@ -0,0 +1,54 @@
+"""
+Unit tests for EcsClusterConfig SSM lookups.
+"""
+
+from cdk_factory.configurations.resources.ecs_cluster import EcsClusterConfig
+
+
+class TestEcsClusterConfigSsm:
+    """Test EcsClusterConfig SSM import/export lookups."""
+
+    def test_ssm_imports_and_exports(self):
+        """Verify imports/exports are read from the ssm block and reused."""
+        config = EcsClusterConfig(
+            {
+                "name": "cluster",
+                "ssm": {
+                    "imports": {"vpc_id": "/app/vpc/id"},
+                    "exports": {"cluster_name": "/app/ecs/cluster-name"},
+                },
+            }
+        )
+
+        assert config.ssm_imports == {"vpc_id": "/app/vpc/id"}
+        assert config.ssm_exports == {"cluster_name": "/app/ecs/cluster-name"}
+        assert config.ssm_imports is config.ssm_imports
+        assert config.ssm_exports is config.ssm_exports
+
+    def test_ssm_defaults(self):
+        """Verify missing ssm settings default to empty dicts."""
+        config = EcsClusterConfig({"name": "cluster"})
+
+        assert config.ssm_imports == {}
+        assert config.ssm_exports == {}
+
+
+class TestEcsClusterConfigManagedPolicies:
+    """Test EcsClusterConfig managed policy defaults."""
+
+    def test_default_managed_policies(self):
+        """Verify the defaults are returned as an independent list."""
+        first = EcsClusterConfig({}).managed_policies
+        first.append("Extra")
+
+        assert EcsClusterConfig({}).managed_policies == [
+            "service-role/AmazonEC2ContainerServiceforEC2Role",
+            "AmazonSSMManagedInstanceCore",
+        ]
+
+    def test_configured_managed_policies(self):
+        """Verify configured policies are returned as-is."""
+        policies = ["ReadOnlyAccess"]
+        config = EcsClusterConfig({"managed_policies": policies})
+
+        assert config.managed_policies is policies
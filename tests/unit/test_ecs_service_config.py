@@ -0,0 +1,45 @@
+"""
+Unit tests for EcsServiceConfig SSM lookups.
+"""
+
+from cdk_factory.configurations.resources.ecs_service import EcsServiceConfig
+
+
+class TestEcsServiceConfigSsm:
+    """Test EcsServiceConfig SSM import/export lookups."""
+
+    def test_ssm_imports_include_load_balancer_imports(self):
+        """Verify load balancer SSM imports are merged into the service imports."""
+        config = EcsServiceConfig(
+            {
+                "ssm": {"imports": {"cluster_name": "/app/ecs/cluster-name"}},
+                "load_balancer": {
+                    "ssm": {"imports": {"target_group_arn": "/app/alb/tg-arn"}}
+                },
+            }
+        )
+
+        assert config.ssm_imports == {
+            "cluster_name": "/app/ecs/cluster-name",
+            "target_group_arn": "/app/alb/tg-arn",
+        }
+        assert config.ssm_imports is config.ssm_imports
+
+    def test_load_balancer_imports_without_service_imports(self):
+        """Verify load balancer imports are returned when the service has none."""
+        config = EcsServiceConfig(
+            {
+                "load_balancer": {
+                    "ssm": {"imports": {"target_group_arn": "/app/alb/tg-arn"}}
+                }
+            }
+        )
+
+        assert config.ssm_imports == {"target_group_arn": "/app/alb/tg-arn"}
+
+    def test_ssm_defaults(self):
+        """Verify missing ssm settings default to empty dicts."""
+        config = EcsServiceConfig({"name": "service"})
+
+        assert config.ssm_imports == {}
+        assert config.ssm_exports == {}
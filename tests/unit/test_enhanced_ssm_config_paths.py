@@ -251,6 +251,61 @@ class TestAttributeFormatting:
         assert "public-subnet-ids" in path
         assert "public_subnet_ids" not in path
 
+    def test_custom_pattern_reused_across_attributes(self):
+        """Test that the pre-filled pattern only varies by attribute"""
+        config = {
+            "ssm": {
+                "workload": "my-app",
+                "pattern": "/{environment}/{workload}/{resource_name}/{attribute}",
+            }
+        }
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main-vpc",
+            workload_config={"environment": "prod", "name": "my-app"},
+        )
+
+        assert ssm_config.get_parameter_path("vpc_id") == "/prod/my-app/main-vpc/vpc-id"
+        assert (
+            ssm_config.get_parameter_path("vpc_cidr")
+            == "/prod/my-app/main-vpc/vpc-cidr"
+        )
+
+    def test_braces_in_values_are_not_treated_as_placeholders(self):
+        """Test that literal braces in config values survive path building"""
+        config = {"ssm": {"workload": "my-{app}"}}
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main-vpc",
+            workload_config={"environment": "prod", "name": "my-app"},
+        )
+
+        path = ssm_config.get_parameter_path("vpc_id")
+        assert path == "/my-{app}/prod/vpc/main-vpc/vpc-id"
+
+    def test_escaped_braces_in_pattern_are_kept_literal(self):
+        """Test that {{...}} in a pattern renders as literal braces"""
+        config = {
+            "ssm": {
+                "workload": "w",
+                "pattern": "/{workload}/{environment}/{{literal}}/{attribute}",
+            }
+        }
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main",
+            workload_config={"environment": "dev", "name": "w"},
+        )
+
+        assert ssm_config.get_parameter_path("vpc_id") == "/w/dev/{literal}/vpc-id"
+        assert ssm_config.get_parameter_path("vpc_cidr") == "/w/dev/{literal}/vpc-cidr"
+
 
 class TestEnvironmentResolution:
     """Test environment resolution from different sources"""
@@ -268,6 +323,41 @@ class TestEnvironmentResolution:
 
         assert ssm_config.environment == "staging"
 
+    def test_environment_variable_resolved_once(self, monkeypatch):
+        """Test that ${VAR} environments are resolved on first access and cached"""
+        monkeypatch.delenv("ENVIRONMENT", raising=False)
+        config = {"ssm": {"workload": "my-app"}}
+
+        # Construction must not fail even though the variable is not set yet
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main-vpc",
+        )
+
+        with pytest.raises(ValueError):
+            _ = ssm_config.environment
+
+        monkeypatch.setenv("ENVIRONMENT", "qa")
+        assert ssm_config.environment == "qa"
+
+        monkeypatch.setenv("ENVIRONMENT", "prod")
+        assert ssm_config.environment == "qa"
+
+    def test_environment_expands_every_placeholder(self, monkeypatch):
+        """Test that each ${VAR} in the environment value is expanded"""
+        monkeypatch.setenv("STAGE", "prod")
+        monkeypatch.setenv("REGION_CODE", "use1")
+        config = {"ssm": {"workload": "my-app", "environment": "${STAGE}-${REGION_CODE}"}}
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main-vpc",
+        )
+
+        assert ssm_config.environment == "prod-use1"
+
     def test_environment_in_generated_path(self):
         """Test environment appears in generated path"""
         config = {"ssm": {"workload": "my-app"}}
@@ -407,6 +497,42 @@ class TestEdgeCases:
 
         assert not ssm_config.enabled
 
+    def test_ssm_disabled_returns_no_definitions(self):
+        """Test that a disabled SSM config produces no export/import definitions"""
+        config = {"ssm": {"enabled": False, "exports": {"vpc_id": "auto"}}}
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="security_group",
+            resource_name="web-sg",
+        )
+
+        # No environment is configured; disabled configs must not need one
+        assert ssm_config.get_export_definitions() == []
+        assert ssm_config.get_import_definitions() == []
+
+    def test_export_definitions_do_not_mutate_config(self):
+        """Test that auto exports are not injected into the config's exports"""
+        config = {"ssm": {"workload": "my-app", "exports": {"vpc_id": "auto"}}}
+
+        ssm_config = EnhancedSsmConfig(
+            config=config,
+            resource_type="vpc",
+            resource_name="main-vpc",
+            workload_config={"environment": "prod", "name": "my-app"},
+        )
+
+        exports = ssm_config.get_export_definitions()
+
+        assert config["ssm"]["exports"] == {"vpc_id": "auto"}
+        assert [e.attribute for e in exports] == [
+            "vpc_id",
+            "vpc_cidr",
+            "public_subnet_ids",
+            "private_subnet_ids",
+            "isolated_subnet_ids",
+        ]
+
     def test_invalid_custom_path_ignored(self):
         """Test that non-string or non-dict export values don't break"""
         config = {
@@ -2,8 +2,11 @@
 
 import json
 import os
+import sys
 import tempfile
 import unittest
+from unittest.mock import patch
+
 from src.cdk_factory.utilities.json_loading_utility import JsonLoadingUtility
 
 
@@ -204,6 +207,25 @@ class TestJsonLoadingUtility(unittest.TestCase):
         result = JsonLoadingUtility.recursive_replace("", {"{{key}}": "value"})
         self.assertEqual(result, "")
 
+    def test_recursive_replace_empty_replacements(self):
+        """Test recursive_replace with no replacements returns an equal copy"""
+        data = {"name": "{{workload-name}}", "items": ["a", {"b": "c"}]}
+
+        result = JsonLoadingUtility.recursive_replace(data, {})
+
+        self.assertEqual(result, data)
+        self.assertIsNot(result, data)
+
+    def test_recursive_replace_overlapping_placeholders(self):
+        """Test that the longest placeholder wins when one is a prefix of another"""
+        replacements = {"{{env": "broken", "{{env}}": "prod"}
+
+        result = JsonLoadingUtility.recursive_replace(
+            {"path": "/{{env}}/app"}, replacements
+        )
+
+        self.assertEqual(result["path"], "/prod/app")
+
 
 class TestJsonLoadingUtilityInheritance(unittest.TestCase):
     """Test cases for __inherits__ functionality"""
@@ -605,5 +627,48 @@ class TestJsonLoadingUtilityImports(unittest.TestCase):
         self.assertEqual(result["new_feature"], False)
 
 
+class TestJsonLoadingUtilitySerialization(unittest.TestCase):
+    """Load/save behave the same with and without orjson installed"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.module = sys.modules[JsonLoadingUtility.__module__]
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _round_trip(self, data):
+        path = os.path.join(self.temp_dir, "config.json")
+        JsonLoadingUtility.save(data, path)
+        with open(path, encoding="utf-8") as f:
+            on_disk = f.read()
+        return on_disk, JsonLoadingUtility(path).load()
+
+    def test_round_trip_with_and_without_orjson(self):
+        """Both backends write indented JSON that loads back unchanged"""
+        data = {"name": "caf\u00e9", "nested": {"list": [1, 2.5, None, True]}}
+
+        with patch.object(self.module, "orjson", None):
+            stdlib_text, stdlib_loaded = self._round_trip(data)
+        fast_text, fast_loaded = self._round_trip(data)
+
+        self.assertEqual(stdlib_loaded, data)
+        self.assertEqual(fast_loaded, data)
+        self.assertEqual(json.loads(fast_text), json.loads(stdlib_text))
+        self.assertIn('\n  "name"', fast_text)
+
+    def test_load_falls_back_for_stdlib_only_json(self):
+        """Values orjson rejects (e.g. NaN) still load via the stdlib parser"""
+        path = os.path.join(self.temp_dir, "nan.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"value": NaN}')
+
+        result = JsonLoadingUtility(path).load()
+
+        self.assertNotEqual(result["value"], result["value"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@
 Unit tests for PipelineConfig cross_account_role_arns property.
 """
 
+import pytest
+
 from cdk_factory.configurations.pipeline import PipelineConfig
 
 
@@ -40,3 +42,102 @@ class TestPipelineConfig:
         config = PipelineConfig(pipeline=pipeline_dict, workload=workload_dict)
 
         assert config.cross_account_role_arns == []
+
+
+class TestPipelineConfigBuildResourceName:
+    """Test PipelineConfig.build_resource_name placeholder handling and caching."""
+
+    @staticmethod
+    def _config(workload_name="test-workload"):
+        return PipelineConfig(
+            pipeline={"name": "test-pipeline", "branch": "main"},
+            workload={"name": workload_name},
+        )
+
+    def test_placeholders_replaced(self, monkeypatch):
+        """Verify workload, pipeline and environment placeholders are replaced."""
+        monkeypatch.setenv("ENVIRONMENT", "dev")
+        config = self._config()
+
+        name = config.build_resource_name(
+            "{{workload-name}}-{{pipeline-name}}-{{environment}}-Bucket"
+        )
+
+        assert name == "test-workload-test-pipeline-dev-bucket"
+
+    def test_environment_change_is_not_served_from_cache(self, monkeypatch):
+        """Verify a changed ENVIRONMENT value produces a fresh name."""
+        config = self._config()
+
+        monkeypatch.setenv("ENVIRONMENT", "dev")
+        assert config.build_resource_name("{{environment}}-api") == "dev-api"
+
+        monkeypatch.setenv("ENVIRONMENT", "prod")
+        assert config.build_resource_name("{{environment}}-api") == "prod-api"
+
+    def test_workload_name_is_part_of_the_key(self, monkeypatch):
+        """Verify two pipelines with different workloads do not share results."""
+        monkeypatch.delenv("ENVIRONMENT", raising=False)
+
+        first = self._config("first").build_resource_name("{{workload-name}}-api")
+        second = self._config("second").build_resource_name("{{workload-name}}-api")
+
+        assert first == "first-api"
+        assert second == "second-api"
+
+    def test_empty_name_raises(self):
+        """Verify an empty name is still rejected."""
+        with pytest.raises(ValueError):
+            self._config().build_resource_name("")
+
+
+class TestPipelineConfigEnabled:
+    """Test PipelineConfig.enabled coercion."""
+
+    def test_enabled_values(self):
+        """Verify enabled accepts bools and "true" strings in any case."""
+        for value, expected in [
+            (True, True),
+            ("true", True),
+            ("TRUE", True),
+            (False, False),
+            ("false", False),
+            (None, False),
+        ]:
+            config = PipelineConfig(
+                pipeline={"name": "test-pipeline", "enabled": value},
+                workload={"name": "test-workload"},
+            )
+            assert config.enabled is expected, value
+
+    def test_enabled_missing(self):
+        """Verify a pipeline without an enabled key is disabled."""
+        config = PipelineConfig(pipeline={"name": "p"}, workload={"name": "w"})
+
+        assert config.enabled is False
+        assert config.workload_name == "w"
+
+
+class TestPipelineConfigStages:
+    """Test PipelineConfig.stages lazy construction."""
+
+    def test_stages_built_once(self):
+        """Verify the stage list is built once and reused."""
+        config = PipelineConfig(
+            pipeline={"name": "p", "stages": [{"name": "build"}, {"name": "test"}]},
+            workload={"name": "w"},
+        )
+
+        stages = config.stages
+
+        assert [stage.name for stage in stages] == ["build", "test"]
+        assert config.stages is stages
+
+    def test_empty_stages_built_once(self):
+        """Verify a pipeline without stages does not rebuild on each access."""
+        config = PipelineConfig(pipeline={"name": "p"}, workload={"name": "w"})
+
+        stages = config.stages
+
+        assert stages == []
+        assert config.stages is stages
@@ -0,0 +1,39 @@
+"""Unit tests for ${NAME} placeholder expansion"""
+
+import pytest
+
+from cdk_factory.utilities.placeholders import expand_placeholders
+
+
+class TestExpandPlaceholders:
+    """Test the shared ${NAME} expansion helper"""
+
+    def test_expands_every_placeholder(self):
+        """Test that each placeholder is resolved in a single pass"""
+        table = {"STAGE": "prod", "REGION_CODE": "use1"}
+
+        assert expand_placeholders("${STAGE}-${REGION_CODE}", table.get) == "prod-use1"
+
+    def test_unresolved_and_non_identifier_placeholders_are_left_as_is(self):
+        """Test that unknown names and non-identifier names are not touched"""
+        table = {"KNOWN": "x"}
+
+        assert (
+            expand_placeholders("${KNOWN}/${UNKNOWN}/${foo-bar}", table.get)
+            == "x/${UNKNOWN}/${foo-bar}"
+        )
+
+    def test_lookup_errors_propagate(self):
+        """Test that a lookup can reject missing names by raising"""
+
+        def require(name: str) -> str:
+            raise ValueError(name)
+
+        with pytest.raises(ValueError, match="MISSING"):
+            expand_placeholders("${MISSING}", require)
+
+    def test_value_without_placeholders_is_returned_unchanged(self):
+        """Test that plain strings skip the regex scan"""
+        value = "no placeholders here"
+
+        assert expand_placeholders(value, {}.get) is value
@@ -0,0 +1,224 @@
+"""Unit tests for the default lambda policy built by PolicyDocuments"""
+
+import unittest
+
+from aws_cdk import App, Stack
+from aws_cdk import aws_iam as iam
+from aws_cdk.assertions import Template
+
+from cdk_factory.constructs.lambdas.policies.policy_docs import (
+    PolicyDocuments,
+    _base_lambda_statements,
+)
+from cdk_factory.configurations.deployment import DeploymentConfig
+from cdk_factory.configurations.resources.lambda_function import LambdaFunctionConfig
+from cdk_factory.configurations.resources.resource_types import ResourceTypes
+from cdk_factory.workload.workload_factory import WorkloadConfig
+
+
+def _make_policy_documents(
+    stack: Stack, lambda_name: str, permissions: list | None = None
+) -> PolicyDocuments:
+    workload = WorkloadConfig(
+        {
+            "workload": {
+                "name": "test-workload",
+                "devops": {"name": "test-devops"},
+            },
+            "region": "us-east-1",
+            "account": "123456789012",
+        }
+    )
+    deployment = DeploymentConfig(
+        workload=workload.dictionary,
+        deployment={
+            "name": "test-deployment",
+            "environment": "dev",
+            "account": "123456789012",
+            "region": "us-east-1",
+        },
+    )
+    role = iam.Role(
+        stack,
+        f"{lambda_name}-role",
+        assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+    )
+    return PolicyDocuments(
+        scope=stack,
+        role=role,
+        lambda_config=LambdaFunctionConfig(
+            {"name": lambda_name, "permissions": permissions or []}
+        ),
+        deployment=deployment,
+    )
+
+
+def _policy_statements(stack: Stack) -> list:
+    policies = Template.from_stack(stack).find_resources("AWS::IAM::Policy")
+    return [
+        policy["Properties"]["PolicyDocument"]["Statement"]
+        for policy in policies.values()
+    ]
+
+
+class TestDefaultLambdaPolicyDoc(unittest.TestCase):
+    """Test cases for the default logs/metrics/x-ray policy"""
+
+    EXPECTED_STATEMENTS = [
+        {
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents",
+            ],
+            "Effect": "Allow",
+            "Resource": "arn:aws:logs:*:*:*",
+        },
+        {
+            "Action": "cloudwatch:PutMetricData",
+            "Effect": "Allow",
+            "Resource": "*",
+        },
+        {
+            "Action": ["xray:PutTraceSegments", "xray:PutTelemetryRecords"],
+            "Effect": "Allow",
+            "Resource": "*",
+            "Sid": "XrayPermissions",
+        },
+    ]
+
+    def test_shared_statements_render_in_every_policy(self):
+        """Each lambda in each stack gets the full set of default statements"""
+        app = App()
+        stacks = [Stack(app, "StackOne"), Stack(app, "StackTwo")]
+
+        for stack in stacks:
+            for lambda_name in ("lambda-a", "lambda-b"):
+                docs = _make_policy_documents(stack, lambda_name)
+                docs.default_lambda_policy_doc().attach_to_role(docs.role)
+
+        for stack in stacks:
+            statements = _policy_statements(stack)
+            self.assertEqual(len(statements), 2)
+            for policy_statements in statements:
+                self.assertEqual(policy_statements, self.EXPECTED_STATEMENTS)
+
+    def test_default_statements_are_not_shared(self):
+        """Each call builds its own PolicyStatement objects"""
+        first = _base_lambda_statements()
+        first[0].add_actions("logs:DescribeLogGroups")
+
+        second = _base_lambda_statements()
+        self.assertIsNot(first[0], second[0])
+        self.assertNotIn(
+            "logs:DescribeLogGroups", second[0].to_statement_json()["Action"]
+        )
+
+    def test_default_policy_nag_suppressions(self):
+        """Every default policy carries the logging/metrics wildcard suppression"""
+        app = App()
+        stack = Stack(app, "TestStack")
+        for lambda_name in ("lambda-a", "lambda-b"):
+            docs = _make_policy_documents(stack, lambda_name)
+            docs.default_lambda_policy_doc().attach_to_role(docs.role)
+
+        policies = Template.from_stack(stack).find_resources("AWS::IAM::Policy")
+        self.assertEqual(len(policies), 2)
+        for policy in policies.values():
+            self.assertEqual(
+                policy["Metadata"]["cdk_nag"]["rules_to_suppress"],
+                [
+                    {
+                        "reason": "Not sure how to get rid of these errors",
+                        "id": "AwsSolutions-IAM5",
+                        "applies_to": [
+                            "Resource::arn:aws:logs:*:*:*",
+                            "Resource::*",
+                        ],
+                    }
+                ],
+            )
+
+
+class TestGenerateAndBindLambdaPolicyDocs(unittest.TestCase):
+    """Test cases for the permission policy and its nag suppressions"""
+
+    def test_nag_suppressions_cover_every_permission(self):
+        """Suppressions from each permission land on the resources policy"""
+        app = App()
+        stack = Stack(app, "TestStack")
+        docs = _make_policy_documents(
+            stack,
+            "lambda-a",
+            permissions=[
+                "parameter_store_read",
+                "cognito_user_pool_read",
+                "cognito_admin",
+            ],
+        )
+        docs.generate_and_bind_lambda_policy_docs()
+
+        policies = Template.from_stack(stack).find_resources("AWS::IAM::Policy")
+        resources_policy = next(
+            policy
+            for logical_id, policy in policies.items()
+            if "resources" in logical_id.lower()
+        )
+        suppressions = resources_policy["Metadata"]["cdk_nag"]["rules_to_suppress"]
+
+        self.assertEqual(
+            [s["applies_to"] for s in suppressions],
+            [["Resource::*"], ["Resource::*", "Action::cognito-idp:*"]],
+        )
+        self.assertTrue(all(s["id"] == "AwsSolutions-IAM5" for s in suppressions))
+
+    def test_permission_details_are_independent_copies(self):
+        """Mutating a looked-up permission does not leak into later lookups"""
+        docs = _make_policy_documents(Stack(App(), "TestStack"), "lambda-a")
+
+        first = docs.get_permission_details("parameter_store_read")
+        first["actions"].append("ssm:PutParameter")
+        first["resources"].append("arn:aws:ssm:::parameter/extra")
+
+        second = docs.get_permission_details("parameter_store_read")
+        self.assertNotIn("ssm:PutParameter", second["actions"])
+        self.assertEqual(second["resources"], ["*"])
+
+
+class TestPolicyDocumentsNaming(unittest.TestCase):
+    """Test cases for names and ARNs derived from the deployment"""
+
+    def test_base_name_is_cached(self):
+        """The lambda's resource name is built once per instance"""
+        docs = _make_policy_documents(Stack(App(), "TestStack"), "lambda-a")
+
+        self.assertEqual(
+            docs.base_name, docs.deployment.build_resource_name("lambda-a")
+        )
+        self.assertIs(docs.base_name, docs.base_name)
+
+    def test_invoke_permission_resources_become_lambda_arns(self):
+        """lambda:InvokeFunction resources are expanded to function ARNs"""
+        docs = _make_policy_documents(Stack(App(), "TestStack"), "lambda-a")
+
+        details = docs.get_permission_details_from_dict(
+            {
+                "name": "Invoke",
+                "sid": "InvokeOthers",
+                "actions": ["lambda:InvokeFunction"],
+                "resources": ["other-a", "other-b"],
+            }
+        )
+
+        prefix = "arn:aws:lambda:us-east-1:123456789012:function:"
+        self.assertEqual(
+            details["resources"],
+            [
+                f"{prefix}{docs.deployment.build_resource_name(name, ResourceTypes.LAMBDA_FUNCTION)}"
+                for name in ("other-a", "other-b")
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit tests for RdsConfig name sanitization.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from cdk_factory.configurations.resources.rds import RdsConfig
+
+
+def _config(**overrides) -> RdsConfig:
+    config = {"name": "db", "engine": "postgres"}
+    config.update(overrides)
+    return RdsConfig(config, deployment=None)
+
+
+class TestRdsConfigSanitization:
+    """Test RdsConfig database name and username sanitization."""
+
+    def test_database_name_sanitized(self):
+        """Verify hyphens become underscores and invalid characters are removed."""
+        assert _config(database_name="my-app.db").database_name == "my_appdb"
+
+    def test_database_name_oracle_keeps_alphanumerics_only(self):
+        """Verify Oracle names drop underscores and are truncated to 8 chars."""
+        config = _config(engine="oracle", database_name="my_oracle_db")
+        assert config.database_name == "myoracle"
+
+    def test_database_name_optional(self):
+        """Verify database_name is None when not configured."""
+        assert _config().database_name is None
+
+    def test_master_username_sanitized(self):
+        """Verify usernames are cleaned, prefixed and kept off reserved words."""
+        assert _config(master_username="app-user!").master_username == "app_user"
+        assert _config(master_username="1admin").master_username == "user1admin"
+        assert _config(master_username="admin").master_username == "admin_usr"
+
+    def test_master_username_required(self):
+        """Verify a missing master username raises on every access."""
+        config = _config()
+        with pytest.raises(ValueError):
+            _ = config.master_username
+        with pytest.raises(ValueError):
+            _ = config.master_username
+
+    def test_sanitization_runs_once(self):
+        """Verify repeated reads reuse the sanitized values."""
+        config = _config(database_name="my-db", master_username="my-user")
+
+        with (
+            patch.object(
+                RdsConfig,
+                "_sanitize_db_name_impl",
+                autospec=True,
+                side_effect=RdsConfig._sanitize_db_name_impl,
+            ) as db_name,
+            patch.object(
+                RdsConfig,
+                "_sanitize_master_username_impl",
+                autospec=True,
+                side_effect=RdsConfig._sanitize_master_username_impl,
+            ) as username,
+        ):
+            for _ in range(3):
+                assert config.database_name == "my_db"
+                assert config.master_username == "my_user"
+
+        assert db_name.call_count == 1
+        assert username.call_count == 1
+
+
+class TestRdsConfigSsm:
+    """Test RdsConfig SSM import/export lookups."""
+
+    def test_ssm_imports_and_exports(self):
+        """Verify imports/exports come from the ssm block and default to empty."""
+        config = _config(
+            ssm={
+                "imports": {"vpc_id": "/app/vpc/id"},
+                "exports": {"db_endpoint": "/app/rds/endpoint"},
+            }
+        )
+
+        assert config.ssm_imports == {"vpc_id": "/app/vpc/id"}
+        assert config.ssm_exports == {"db_endpoint": "/app/rds/endpoint"}
+        assert config.ssm_imports is config.ssm_imports
+        assert _config().ssm_imports == {}
+        assert _config().ssm_exports == {}
+
+
+class TestRdsConfigRequiredSettings:
+    """Test RdsConfig settings that are validated when read."""
+
+    def test_engine_version_and_secret_name(self):
+        """Verify configured values are returned."""
+        config = _config(engine_version="16.3", secret_name="/app/rds/creds")
+
+        assert config.engine_version == "16.3"
+        assert config.secret_name == "/app/rds/creds"
+
+    def test_missing_values_raise_on_every_read(self):
+        """Verify missing values raise when read, not at construction."""
+        config = _config()
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _ = config.engine_version
+            with pytest.raises(ValueError):
+                _ = config.secret_name
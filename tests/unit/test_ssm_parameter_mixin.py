@@ -0,0 +1,72 @@
+"""
+Unit tests for SsmParameterMixin exports
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from aws_cdk import App, Stack
+from aws_cdk.assertions import Template
+
+from cdk_factory.interfaces.ssm_parameter_mixin import (
+    SsmConfigError,
+    SsmParameterMixin,
+)
+
+
+class TestExportSsmParametersFromConfig(unittest.TestCase):
+    """Test exporting SSM parameters from a config mapping"""
+
+    def setUp(self):
+        self.stack = Stack(App(), "TestStack")
+        self.mixin = SsmParameterMixin()
+
+    def test_exports_configured_keys(self):
+        """Keys with a path are exported, keys without one are skipped"""
+        parameters = self.mixin.export_ssm_parameters_from_config(
+            scope=self.stack,
+            config_dict={"vpc_id": "vpc-123", "subnet_ids": "subnet-1,subnet-2"},
+            ssm_config={"vpc_id": "/test/vpc/id", "subnet_ids": ""},
+            resource="vpc-",
+        )
+
+        self.assertEqual(list(parameters), ["vpc_id"])
+        template = Template.from_stack(self.stack)
+        template.resource_count_is("AWS::SSM::Parameter", 1)
+        template.has_resource_properties(
+            "AWS::SSM::Parameter", {"Name": "/test/vpc/id", "Value": "vpc-123"}
+        )
+
+    def test_missing_keys_raise(self):
+        """Misspelled keys raise before any parameter is created"""
+        with self.assertRaises(SsmConfigError) as ctx:
+            self.mixin.export_ssm_parameters_from_config(
+                scope=self.stack,
+                config_dict={"vpc_id": "vpc-123"},
+                ssm_config={"vpc_id": "/test/vpc/id", "vpcid": "/test/vpc/typo"},
+            )
+
+        self.assertIn("vpcid", str(ctx.exception))
+        self.assertIsInstance(ctx.exception, ValueError)
+        Template.from_stack(self.stack).resource_count_is("AWS::SSM::Parameter", 0)
+
+
+class TestImportResourcesFromSsm(unittest.TestCase):
+    """Test importing resource values from SSM"""
+
+    def test_path_suffix_is_dropped_from_keys(self):
+        """Keys ending in _path are returned without the suffix"""
+        stack = Stack(App(), "TestStack")
+        config = SimpleNamespace(
+            ssm_imports={"vpc_id_path": "/test/vpc/id", "subnet_ids": "/test/subnets"}
+        )
+
+        imported = SsmParameterMixin().import_resources_from_ssm(
+            scope=stack, config=config, resource_name="vpc"
+        )
+
+        self.assertEqual(sorted(imported), ["subnet_ids", "vpc_id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit tests for StackConfig enabled flag.
+"""
+
+import pytest
+
+from cdk_factory.configurations.stack import StackConfig
+
+
+class TestStackConfigEnabled:
+    """Test StackConfig.enabled coercion."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (True, True),
+            ("true", True),
+            ("True", True),
+            (False, False),
+            ("false", False),
+            ("yes", False),
+            (1, False),
+            (None, False),
+        ],
+    )
+    def test_enabled_values(self, value, expected):
+        """Verify only True and case-insensitive "true" enable a stack."""
+        config = StackConfig({"name": "stack", "enabled": value}, workload={})
+        assert config.enabled is expected
+
+    def test_enabled_missing(self):
+        """Verify a stack without an enabled key is disabled."""
+        assert StackConfig({"name": "stack"}, workload={}).enabled is False
+
+
+class TestStackConfigNameAndModule:
+    """Test StackConfig name and module validation."""
+
+    def test_name_and_module(self):
+        """Verify configured values are returned."""
+        config = StackConfig({"name": "stack", "module": "vpc_library"}, workload={})
+
+        assert config.name == "stack"
+        assert config.module == "vpc_library"
+        assert config.build_id() == "stack"
+
+    def test_missing_values_raise_on_every_read(self):
+        """Verify missing values raise when read, not at construction."""
+        config = StackConfig({}, workload={})
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="name"):
+                _ = config.name
+            with pytest.raises(ValueError, match="module"):
+                _ = config.module
@@ -0,0 +1,71 @@
+"""
+Unit tests for StandardizedSsmMixin import processing
+"""
+
+import unittest
+
+from aws_cdk import App, Stack
+
+from cdk_factory.interfaces.standardized_ssm_mixin import StandardizedSsmMixin
+
+
+class MockStack(Stack, StandardizedSsmMixin):
+    """Stack with the standardized SSM mixin"""
+
+    pass
+
+
+class TestStandardizedSsmImports(unittest.TestCase):
+    """Test SSM import resolution"""
+
+    def _process(self, imports: dict) -> MockStack:
+        stack = MockStack(App(), "TestStack")
+        stack.setup_ssm_integration(
+            scope=stack,
+            config={"ssm": {"imports": imports}},
+            resource_type="test",
+            resource_name="resource",
+        )
+        stack.process_ssm_imports()
+        return stack
+
+    def _import_constructs(self, stack: MockStack) -> list:
+        return [
+            child.node.id
+            for child in stack.node.children
+            if child.node.id.startswith("import-")
+            and not child.node.id.endswith(".Parameter")
+        ]
+
+    def test_repeated_path_is_imported_once(self):
+        """Imports that share an SSM path share one parameter reference"""
+        stack = self._process(
+            {
+                "vpc_id": "/shared/vpc/id",
+                "security_group_ids": ["/shared/vpc/id", "/shared/sg/id"],
+            }
+        )
+
+        vpc_id = stack.get_ssm_imported_value("vpc_id")
+        sg_ids = stack.get_ssm_imported_value("security_group_ids")
+
+        self.assertEqual(sg_ids[0], vpc_id)
+        self.assertNotEqual(sg_ids[1], vpc_id)
+        self.assertEqual(
+            self._import_constructs(stack),
+            ["import-vpc_id", "import-security_group_ids-1-"],
+        )
+
+    def test_distinct_paths_are_imported_separately(self):
+        """Each distinct path gets its own parameter reference"""
+        stack = self._process({"vpc_id": "/shared/vpc/id", "sg_id": "/shared/sg/id"})
+
+        self.assertNotEqual(
+            stack.get_ssm_imported_value("vpc_id"),
+            stack.get_ssm_imported_value("sg_id"),
+        )
+        self.assertEqual(len(self._import_constructs(stack)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for WorkloadConfig search paths.
+"""
+
+import pytest
+
+from cdk_factory.workload.workload_factory import WorkloadConfig
+
+
+def _workload() -> WorkloadConfig:
+    return WorkloadConfig(
+        {"workload": {"name": "test-workload", "devops": {"name": "test-devops"}}}
+    )
+
+
+class TestWorkloadConfigPaths:
+    """Test WorkloadConfig.paths normalization."""
+
+    def test_paths_deduplicated_in_order(self, tmp_path):
+        """Verify files become their directory and duplicates keep first position."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        app_file = first / "app.py"
+        app_file.write_text("")
+
+        workload = _workload()
+        workload.paths = [str(second), str(app_file), str(first), str(second)]
+
+        assert workload.paths == [str(second), str(first)]
+
+    def test_paths_empty(self):
+        """Verify an empty list is accepted."""
+        workload = _workload()
+        workload.paths = []
+        assert workload.paths == []
+
+
+class TestWorkloadConfigValidation:
+    """Test WorkloadConfig workload and name validation."""
+
+    def test_non_dict_workload_rejected(self):
+        """Verify a non-dict workload section is rejected at construction."""
+        with pytest.raises(ValueError, match="not a dictionary"):
+            WorkloadConfig({"workload": ["not", "a", "dict"]})
+
+    def test_name(self):
+        """Verify the workload name is returned."""
+        assert _workload().name == "test-workload"
+
+    def test_missing_name_raises(self):
+        """Verify a missing name raises on every read."""
+        workload = WorkloadConfig({"workload": {"devops": {"name": "test-devops"}}})
+        for _ in range(2):
+            with pytest.raises(ValueError, match="name is required"):
+                _ = workload.name
+
+
+class TestWorkloadConfigDomain:
+    """Test WorkloadConfig.domain normalization."""
+
+    def test_domain_lower_cased(self):
+        """Verify the primary domain is lower-cased."""
+        workload = WorkloadConfig(
+            {
+                "workload": {
+                    "name": "test-workload",
+                    "primary_domain": "Example.COM",
+                    "devops": {"name": "test-devops"},
+                }
+            }
+        )
+        assert workload.domain == "example.com"
+
+    def test_domain_missing_or_invalid(self):
+        """Verify a missing or non-string primary domain returns None."""
+        assert _workload().domain is None
+
+        workload = WorkloadConfig(
+            {
+                "workload": {
+                    "name": "test-workload",
+                    "primary_domain": 42,
+                    "devops": {"name": "test-devops"},
+                }
+            }
+        )
+        assert workload.domain is None